@@ -21,6 +21,8 @@ from enum import Enum
 import json
 from datetime import datetime
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -109,26 +111,20 @@ class SeismicSynthesizerCalibrator:
                     error_message="No sonic logs provided"
                 )
             
-            # Step 2: Calculate acoustic impedance (velocity × density)
-            impedance_profiles = []
-            for sonic_log, density_log in zip(borehole_sonic_logs, borehole_density_logs):
-                # DT (µs/ft) -> velocity (m/s): V = 3280.84 / DT
-                velocity_ms = 3280.84 / sonic_log.get("dt_us_ft", 100)
-                density_kg_m3 = density_log.get("rhob_kg_m3", 2650)
-                impedance = velocity_ms * density_kg_m3
-                
-                impedance_profiles.append({
-                    "depth_m": sonic_log.get("depth_m"),
-                    "impedance": impedance,
-                    "velocity": velocity_ms,
-                    "density": density_kg_m3
-                })
+            # Step 2: Pull the paired log samples into columns once
+            n = min(len(borehole_sonic_logs), len(borehole_density_logs))
+            dt_us_ft = np.array([log.get("dt_us_ft", 100) for log in borehole_sonic_logs[:n]], dtype=np.float64)
+            depth_m = np.array([log.get("depth_m") for log in borehole_sonic_logs[:n]], dtype=np.float64)
+            if np.any(dt_us_ft == 0):
+                raise ZeroDivisionError("dt_us_ft must be non-zero")
+            
+            # DT (µs/ft) -> velocity (m/s): V = 3280.84 / DT
+            # (acoustic impedance = velocity × rhob_kg_m3, unused by the wavelet fit)
+            velocity_ms = 3280.84 / dt_us_ft
             
             # Step 3: Extract wavelet from synthetic seismogram
             # (Ideally using Ricker or phase analysis)
-            wavelet_params = SeismicSynthesizerCalibrator._extract_wavelet(
-                impedance_profiles
-            )
+            wavelet_params = SeismicSynthesizerCalibrator._extract_wavelet(depth_m, velocity_ms)
             
             # Step 4: Calculate calibration factor
             # Compare extracted wavelet to model's current wavelet
@@ -154,7 +150,7 @@ class SeismicSynthesizerCalibrator:
                 calibration_factor=calibration_factor,
                 success=True,
                 execution_time_ms=int(execution_ms),
-                ground_truth_records_used=len(impedance_profiles)
+                ground_truth_records_used=n
             )
             
         except Exception as e:
@@ -171,29 +167,25 @@ class SeismicSynthesizerCalibrator:
             )
 
     @staticmethod
-    def _extract_wavelet(impedance_profiles: List[Dict]) -> Dict:
+    def _extract_wavelet(depth_m: np.ndarray, velocity_ms: np.ndarray) -> Dict:
         """
         Extract dominant wavelet from impedance contrasts.
         Simplified: compute frequency characteristics from impedance layer thickness.
         """
-        if len(impedance_profiles) < 2:
+        if len(depth_m) < 2:
             return {"peak_freq_hz": 50, "bandwidth": "broad"}
         
         # Layer thickness from impedance changes
-        thicknesses = []
-        for i in range(1, len(impedance_profiles)):
-            depth_delta = (impedance_profiles[i]["depth_m"] - 
-                          impedance_profiles[i-1]["depth_m"])
-            if depth_delta > 0:
-                thicknesses.append(depth_delta)
-        
-        if not thicknesses:
+        depth_delta = np.diff(depth_m)
+        thicknesses = depth_delta[depth_delta > 0]
+        
+        if len(thicknesses) == 0:
             return {"peak_freq_hz": 50, "bandwidth": "broad"}
         
         # Dominant frequency ≈ velocity / (4 × layer_thickness)
         # Using average velocity and layer thickness
-        avg_velocity = sum(p["velocity"] for p in impedance_profiles) / len(impedance_profiles)
-        avg_thickness = sum(thicknesses) / len(thicknesses)
+        avg_velocity = float(velocity_ms.mean())
+        avg_thickness = float(thicknesses.mean())
         
         dominant_freq = avg_velocity / (4 * max(avg_thickness, 1))
         
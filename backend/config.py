@@ -37,6 +37,15 @@ class Settings:
     DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", "20"))
     DATABASE_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
     DATABASE_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", "3600"))
+    DATABASE_POOL_WARM_SIZE: int = int(os.getenv("DATABASE_POOL_WARM_SIZE", "5"))
+    DATABASE_HEALTH_TIMEOUT_S: float = float(os.getenv("DATABASE_HEALTH_TIMEOUT_S", "2.0"))
+    # Readiness reuses a DB probe result for this long (liveness never probes)
+    HEALTH_DB_PROBE_TTL_S: float = float(os.getenv("HEALTH_DB_PROBE_TTL_S", "5.0"))
+    # /health answers 503 when the DB probe fails; defaults on only when a DB is configured
+    HEALTH_REQUIRES_DATABASE: bool = os.getenv(
+        "HEALTH_REQUIRES_DATABASE",
+        "true" if os.getenv("DATABASE_URL") else "false"
+    ).lower() == "true"
     DATABASE_ECHO: bool = DEBUG
 
     # Redis Configuration
@@ -50,6 +59,8 @@ class Settings:
     GEE_PROJECT_ID: str = os.getenv("GEE_PROJECT_ID", "aurora-osi-gee")
     GEE_REQUEST_TIMEOUT: int = int(os.getenv("GEE_REQUEST_TIMEOUT", "300"))
     GEE_BATCH_SIZE: int = int(os.getenv("GEE_BATCH_SIZE", "100"))
+    GEE_MAX_CONCURRENCY: int = int(os.getenv("GEE_MAX_CONCURRENCY", "8"))
+    GEE_READY_TIMEOUT_S: float = float(os.getenv("GEE_READY_TIMEOUT_S", "10"))
     ENABLE_GEE_INTEGRATION: bool = (GEE_SERVICE_ACCOUNT_FILE is not None or GEE_SERVICE_ACCOUNT_JSON is not None)
 
     # Authentication Configuration
@@ -74,6 +85,8 @@ class Settings:
     CORS_CREDENTIALS: bool = True
     CORS_METHODS: list = ["*"]
     CORS_HEADERS: list = ["*"]
+    # Seconds browsers may cache a preflight (Chromium caps this at 7200)
+    CORS_MAX_AGE: int = int(os.getenv("CORS_MAX_AGE", "7200"))
 
     # Celery Configuration
     CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/1")
@@ -97,6 +110,7 @@ class Settings:
     RATE_LIMIT_PERIOD: int = int(os.getenv("RATE_LIMIT_PERIOD", "60"))
 
     # Satellite Configuration
+    SATELLITE_TASK_CONCURRENCY: int = int(os.getenv("SATELLITE_TASK_CONCURRENCY", "16"))
     SATELLITE_BANDS: dict = {
         "Sentinel-2": {
             "resolution": 10,
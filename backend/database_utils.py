@@ -6,7 +6,7 @@ High-level functions for scan persistence, retrieval, and updates
 import json
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 from .database_manager import get_db
 
@@ -223,27 +223,97 @@ class ScanDatabase:
             return {"error": str(e), "code": "VIZ_UPDATE_ERROR"}
 
     @staticmethod
-    def get_all_scans(limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
-        """Retrieve all scans with pagination"""
-        logger.info(f"🗄️ get_all_scans called: limit={limit}, offset={offset}")
+    def finalize_scan(scan_id: str, step_outputs: Dict[str, str], viz_2d: Optional[str] = None,
+                      viz_3d: Optional[str] = None, status: str = 'completed') -> Dict[str, Any]:
+        """
+        Write step outputs, visualizations and the final status in one round-trip.
+        step_outputs: {'pinn'|'ushe'|'tmal': JSON string}; missing steps are left untouched
+        All statements go to the server as a single batch inside one transaction.
+        """
+        try:
+            db = _get_db_manager()
+            if not db:
+                logger.warning("Database unavailable for scan finalization")
+                return {"error": "Database unavailable", "code": "DB_UNAVAILABLE"}
+            
+            now = datetime.utcnow()
+            statements = []
+            params = []
+            
+            steps = [step for step in ('pinn', 'ushe', 'tmal') if step_outputs.get(step) is not None]
+            if steps:
+                assignments = ", ".join(
+                    f"{step}_output_json = %s, {step}_status = 'completed', {step}_completed_at = %s" for step in steps
+                )
+                statements.append(f"UPDATE scan_results SET {assignments}, updated_at = %s WHERE scan_id = %s")
+                for step in steps:
+                    params += [step_outputs[step], now]
+                params += [now, scan_id]
+            
+            viz_assignments = []
+            for column, data in (('visualization_2d', viz_2d), ('visualization_3d', viz_3d)):
+                if data:
+                    viz_assignments.append(f"{column}_data = %s, {column}_generated_at = %s")
+                    params += [data, now]
+            if viz_assignments:
+                statements.append(f"UPDATE visualizations SET {', '.join(viz_assignments)}, updated_at = %s WHERE scan_id = %s")
+                params += [now, scan_id]
+            
+            if status == 'completed':
+                statements.append("""
+                    UPDATE scans 
+                    SET overall_status = %s, completed_at = %s, duration_seconds = EXTRACT(EPOCH FROM (NOW() - started_at))::INTEGER
+                    WHERE id = %s
+                """)
+                params += [status, now, scan_id]
+            else:
+                statements.append("UPDATE scans SET overall_status = %s WHERE id = %s")
+                params += [status, scan_id]
+            
+            with db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(";".join(statements), params)
+                    
+            logger.info(f"✓ Finalized scan {scan_id} ({', '.join(steps) or 'no steps'}) as {status}")
+            return {"success": True}
+            
+        except Exception as e:
+            logger.error(f"✗ Failed to finalize scan: {str(e)}")
+            return {"error": str(e), "code": "SCAN_FINALIZE_ERROR"}
+
+    @staticmethod
+    def get_all_scans(limit: int = 50, offset: int = 0,
+                      after: Optional[Tuple[datetime, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieve scans newest first.
+        after: (timestamp, id) of the last row already seen - keyset pagination,
+               so deep pages cost the same as the first (offset is ignored when set)
+        """
         try:
             db = _get_db_manager()
-            logger.info(f"🗄️ _get_db_manager returned: {db}")
             if not db:
                 logger.warning("🗄️ Database manager returned None - returning empty list")
                 return []
             
-            logger.info(f"🗄️ Calling db.get_connection()")
             with db.get_connection() as conn:
-                logger.info(f"🗄️ Connection established, executing query")
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id, scan_name, latitude, longitude, timestamp, overall_status, 
-                               started_at, completed_at, duration_seconds
-                        FROM scans
-                        ORDER BY timestamp DESC
-                        LIMIT %s OFFSET %s
-                    """, (limit, offset))
+                    if after is not None:
+                        cur.execute("""
+                            SELECT id, scan_name, latitude, longitude, timestamp, overall_status, 
+                                   started_at, completed_at, duration_seconds
+                            FROM scans
+                            WHERE (timestamp, id) < (%s, %s)
+                            ORDER BY timestamp DESC, id DESC
+                            LIMIT %s
+                        """, (after[0], after[1], limit))
+                    else:
+                        cur.execute("""
+                            SELECT id, scan_name, latitude, longitude, timestamp, overall_status, 
+                                   started_at, completed_at, duration_seconds
+                            FROM scans
+                            ORDER BY timestamp DESC, id DESC
+                            LIMIT %s OFFSET %s
+                        """, (limit, offset))
                     
                     rows = cur.fetchall()
                     scans = []
@@ -260,7 +330,7 @@ class ScanDatabase:
                             "duration_seconds": row[8]
                         })
                     
-            logger.info(f"✓ Retrieved {len(scans)} scans")
+            logger.debug("Retrieved %d scans (limit=%d, offset=%d)", len(scans), limit, offset)
             return scans
             
         except Exception as e:
@@ -10,18 +10,69 @@ This module implements:
 5. Mineral-specific contextual logic
 """
 
+import copy
 import json
 import hashlib
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+from functools import lru_cache
+from itertools import islice
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 import math
 
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_KM = 6371.0
+RISK_CACHE_QUANTUM = 1e-4  # degrees (~11 m) - dry-hole risk memo cell size
+
+
+def _to_ecef(lat, lon):
+    """Lat/lon (degrees) to Cartesian km on a spherical Earth"""
+    lat_r = np.radians(lat)
+    lon_r = np.radians(lon)
+    cos_lat = np.cos(lat_r)
+    return np.stack([
+        EARTH_RADIUS_KM * cos_lat * np.cos(lon_r),
+        EARTH_RADIUS_KM * cos_lat * np.sin(lon_r),
+        EARTH_RADIUS_KM * np.sin(lat_r),
+    ], axis=-1)
+
+
+# Coarse density grid: ~5.5 km cells keyed by (lat row, lon col)
+_CELL_DEG = 0.05
+_LON_CELLS = int(round(360 / _CELL_DEG))
+_MAX_DENSITY_CELLS = 1024
+
+
+def _cell_key(lat: float, lon: float) -> Tuple[int, int]:
+    return math.floor(lat / _CELL_DEG), math.floor(lon / _CELL_DEG) % _LON_CELLS
+
+
+_FAVOURABLE_CONTROLS = frozenset(('fault_zone', 'fold_hinge'))
+
+
+def _grown(column: np.ndarray, n: int, fill) -> np.ndarray:
+    """Copy of column's first n rows in a buffer of twice the length"""
+    out = np.full((2 * n,) + column.shape[1:], fill, dtype=column.dtype)
+    out[:n] = column[:n]
+    return out
+
+
+def _chord_km(radius_km: float) -> float:
+    """Straight-line distance matching a great-circle distance of radius_km"""
+    half_angle = min(radius_km / (2 * EARTH_RADIUS_KM), math.pi / 2)
+    return 2 * EARTH_RADIUS_KM * math.sin(half_angle)
+
 
 # ============================================================================
 # ENUMS & DATA STRUCTURES
@@ -91,6 +142,14 @@ class Mineral(Enum):
         self.context = context
 
 
+# Economic grade cutoffs used by dry-hole risk
+_ECONOMIC_CUTOFFS = {
+    Mineral.GOLD: 0.5,      # g/t
+    Mineral.LITHIUM: 0.1,   # % Li2O
+    Mineral.COPPER: 0.3,    # %
+}
+
+
 class ConflictStatus(Enum):
     """Conflict resolution states"""
     CLEAN = "clean"                      # No conflicts detected
@@ -99,7 +158,7 @@ class ConflictStatus(Enum):
     FLAGGED_VS_NEIGHBOR = "flagged_vs_neighbor"    # Nearby data contradicts
 
 
-@dataclass
+@dataclass(slots=True)
 class AuroraCommonSchema:
     """Aurora Common Schema (ACS) - Standardized record format"""
     
@@ -147,6 +206,19 @@ class AuroraCommonSchema:
             if v is not None
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any],
+                  defaults: Optional[Dict[str, Any]] = None) -> "AuroraCommonSchema":
+        """
+        Build a record from a plain dict (e.g. a JSON payload) in one call.
+        Unknown keys are ignored; `defaults` fill fields the dict omits.
+        """
+        known = cls.__dataclass_fields__
+        fields = {k: v for k, v in data.items() if k in known}
+        if fields.get("mineral_context") is None:
+            fields["mineral_context"] = {}
+        return cls(**{**defaults, **fields}) if defaults else cls(**fields)
+
 
 @dataclass
 class GTCScoreInput:
@@ -190,6 +262,24 @@ class GroundTruthVault:
         self.conflicts: List[ConflictRecord] = []
         self.gtc_cache: Dict[str, float] = {}
         self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # Spatial columns (SoA), aligned with _record_ids by insertion index and
+        # grown geometrically; rows below _n are never rewritten. _grade holds
+        # detected assay_ppm values (NaN otherwise), _relevant flags
+        # assay/lithology rows, _struct is -1 (no structural control),
+        # 0 (other) or 1 (favourable). The kd-tree covers the first
+        # n_indexed rows and is rebuilt lazily (see _spatial_index)
+        self._record_ids: List[str] = []
+        self._n = 0
+        self._xyz = np.empty((64, 3))
+        self._grade = np.full(64, np.nan)
+        self._relevant = np.zeros(64, dtype=bool)
+        self._struct = np.full(64, -1, dtype=np.int8)
+        self._index: Tuple[int, Any] = (0, None)
+        self._cell_counts: Dict[Tuple[int, int], int] = {}
+        
+        # Dry-hole risk memo keyed by (lat cell, lon cell, mineral, radius)
+        self._dry_hole_risk_cached = lru_cache(maxsize=4096)(self._dry_hole_risk_for_cell)
 
     def ingest_record(self, acs: AuroraCommonSchema) -> Tuple[str, bool, Optional[str]]:
         """
@@ -198,37 +288,53 @@ class GroundTruthVault:
         Returns:
             (record_id, success, error_message)
         """
-        try:
-            record_id = str(uuid.uuid4())
-            
-            # Validate schema
-            if not self._validate_acs(acs):
-                return record_id, False, "Aurora Common Schema validation failed"
-            
-            # Compute data hash for provenance
-            data_hash = self._compute_data_hash(acs)
-            
-            # Check for conflicts with existing records
-            nearby_conflicts = self._detect_conflicts(acs)
-            if nearby_conflicts:
-                acs.validation_status = ValidationStatus.RAW.value
-                conflict_details = [f"{c.conflict_type} (Δ={c.delta_percent:.1f}%)" 
-                                  for c in nearby_conflicts]
-                self.logger.warning(f"Record {record_id}: Conflicts detected: {', '.join(conflict_details)}")
-                self.conflicts.extend(nearby_conflicts)
-            
-            # Store record
-            self.records[record_id] = acs
-            
+        ids, errors = self.ingest_records([acs])
+        if errors:
+            return "", False, errors[0]["error"]
+        return ids[0], True, None
+
+    def ingest_records(self, records: List[AuroraCommonSchema]) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Ingest a batch of records. Each record is still checked for conflicts
+        against everything stored before it (including earlier batch entries);
+        cache invalidation and logging happen once per batch.
+        
+        Returns:
+            (record_ids, errors) - errors are {"index", "error"} for rejected records
+        """
+        ids: List[str] = []
+        errors: List[Dict[str, Any]] = []
+        conflicted = 0
+        
+        for index, acs in enumerate(records):
+            try:
+                if not self._validate_acs(acs):
+                    errors.append({"index": index, "error": "Aurora Common Schema validation failed"})
+                    continue
+                
+                # Check for conflicts with existing records
+                nearby_conflicts = self._detect_conflicts(acs)
+                if nearby_conflicts:
+                    acs.validation_status = ValidationStatus.RAW.value
+                    self.conflicts.extend(nearby_conflicts)
+                    conflicted += 1
+                
+                record_id = str(uuid.uuid4())
+                self.records[record_id] = acs
+                self._append_columns(record_id, acs)
+                ids.append(record_id)
+            except Exception as e:
+                self.logger.error(f"✗ Ingestion error (record {index}): {str(e)}")
+                errors.append({"index": index, "error": str(e)})
+        
+        if ids:
             # Invalidate GTC cache for nearby records
             self.gtc_cache.clear()
-            
-            self.logger.info(f"✓ Record {record_id} ingested: {acs.measurement_type} @ ({acs.latitude}, {acs.longitude})")
-            return record_id, True, None
-            
-        except Exception as e:
-            self.logger.error(f"✗ Ingestion error: {str(e)}")
-            return "", False, str(e)
+            self._dry_hole_risk_cached.cache_clear()
+        if conflicted:
+            self.logger.warning(f"Conflicts detected for {conflicted}/{len(ids)} ingested records")
+        self.logger.info(f"✓ Ingested {len(ids)}/{len(records)} records")
+        return ids, errors
 
     def _validate_acs(self, acs: AuroraCommonSchema) -> bool:
         """Validate Aurora Common Schema record"""
@@ -313,19 +419,82 @@ class GroundTruthVault:
         
         return conflicts
 
+    def _append_columns(self, record_id: str, acs: AuroraCommonSchema) -> None:
+        """Append a stored record's row to the spatial/grade columns"""
+        n = self._n
+        if n == len(self._xyz):
+            # Grow into fresh buffers so readers holding the old ones stay valid
+            self._xyz = _grown(self._xyz, n, 0.0)
+            self._grade = _grown(self._grade, n, np.nan)
+            self._relevant = _grown(self._relevant, n, False)
+            self._struct = _grown(self._struct, n, -1)
+        
+        self._xyz[n] = _to_ecef(acs.latitude, acs.longitude)
+        if (acs.measurement_type == 'assay_ppm' and acs.measurement_value is not None
+                and not acs.is_non_detect):
+            self._grade[n] = acs.measurement_value
+        self._relevant[n] = acs.measurement_type in ('assay_ppm', 'lithology')
+        if acs.structural_control is not None:
+            self._struct[n] = acs.structural_control in _FAVOURABLE_CONTROLS
+        self._record_ids.append(record_id)
+        self._n = n + 1
+        
+        cell = _cell_key(acs.latitude, acs.longitude)
+        self._cell_counts[cell] = self._cell_counts.get(cell, 0) + 1
+
+    def _count_in_covering_cells(self, lat: float, lon: float, radius_km: float) -> Optional[int]:
+        """
+        Records in the grid cells covering a radius around (lat, lon) - an
+        upper bound on the exact radius count. None when the block would be
+        too large (big radius, polar latitudes) to beat the kd-tree.
+        """
+        dlat = radius_km / 110.0  # slightly under 111 km/deg, so the block over-covers
+        if abs(lat) + dlat >= 89.0:
+            return None
+        dlon = dlat / math.cos(math.radians(abs(lat) + dlat))
+        
+        row_lo, col_lo = _cell_key(lat - dlat, lon - dlon)
+        row_hi, col_hi = _cell_key(lat + dlat, lon + dlon)
+        n_cols = (col_hi - col_lo) % _LON_CELLS + 1
+        if (row_hi - row_lo + 1) * n_cols > _MAX_DENSITY_CELLS:
+            return None
+        
+        counts = self._cell_counts
+        return sum(
+            counts.get((row, (col_lo + c) % _LON_CELLS), 0)
+            for row in range(row_lo, row_hi + 1)
+            for c in range(n_cols)
+        )
+
+    def _spatial_index(self) -> Tuple[int, Any]:
+        """(n_indexed, kd-tree); rebuilt when the unindexed tail gets long"""
+        n_indexed, tree = self._index
+        total = self._n
+        if cKDTree is not None and total - n_indexed > max(256, n_indexed // 8):
+            n_indexed = total
+            tree = cKDTree(self._xyz[:total], leafsize=16)
+            self._index = (n_indexed, tree)
+        return n_indexed, tree
+
+    def _nearby_indices(self, lat: float, lon: float, radius_km: float) -> np.ndarray:
+        """Column indices of records within a great-circle radius (ascending)"""
+        n = self._n
+        xyz = self._xyz
+        target = _to_ecef(lat, lon)
+        chord = _chord_km(radius_km)
+        n_indexed, tree = self._spatial_index()
+        n_indexed = min(n_indexed, n) if tree is not None else 0
+        
+        indexed = np.sort(np.asarray(tree.query_ball_point(target, r=chord), dtype=np.intp)) \
+            if n_indexed else np.empty(0, dtype=np.intp)
+        tail = n_indexed + np.flatnonzero(((xyz[n_indexed:n] - target) ** 2).sum(axis=1) <= chord * chord)
+        return np.concatenate([indexed, tail])
+
     def _find_nearby_records(self, lat: float, lon: float, 
                             radius_km: float) -> List[Tuple[str, AuroraCommonSchema]]:
-        """Find records within geographic radius"""
-        nearby = []
-        lat_delta = radius_km / 111.0  # 1 degree latitude ≈ 111 km
-        lon_delta = lat_delta / math.cos(math.radians(lat))
-        
-        for rec_id, rec in self.records.items():
-            if (abs(rec.latitude - lat) < lat_delta and 
-                abs(rec.longitude - lon) < lon_delta):
-                nearby.append((rec_id, rec))
-        
-        return nearby
+        """Find records within a great-circle radius (insertion order)"""
+        ids = self._record_ids
+        return [(ids[i], self.records[ids[i]]) for i in self._nearby_indices(lat, lon, radius_km)]
 
     def calculate_gtc_score(self, record_id: str) -> float:
         """
@@ -470,28 +639,45 @@ class GroundTruthVault:
                 'confidence_90_high': float,
                 'anchor_records': [record_ids]
             }
+        
+        Results are memoised per ~11 m cell (RISK_CACHE_QUANTUM degrees) and
+        evaluated at the cell centre; the cache is cleared on ingest.
         """
+        lat_q = round(target_lat / RISK_CACHE_QUANTUM)
+        lon_q = round(target_lon / RISK_CACHE_QUANTUM)
+        cached = self._dry_hole_risk_cached(lat_q, lon_q, mineral, float(search_radius_km))
+        # Fresh containers per call - the memoised entry is shared by every caller
+        return {
+            **cached,
+            "anchor_records": list(cached["anchor_records"]),
+            "mineral_context": copy.deepcopy(cached["mineral_context"])
+        }
+
+    def _dry_hole_risk_for_cell(self, lat_q: int, lon_q: int, mineral: Mineral,
+                                search_radius_km: float) -> Dict[str, Any]:
+        """Uncached dry-hole risk at a quantised cell centre (anchor_records as a tuple)"""
+        target_lat = lat_q * RISK_CACHE_QUANTUM
+        target_lon = lon_q * RISK_CACHE_QUANTUM
         
         # 1. DATA DENSITY CHECK
-        nearby_records = self._find_nearby_records(target_lat, target_lon, search_radius_km)
-        mineral_relevant = [r for r in nearby_records 
-                           if r[1].measurement_type in ['assay_ppm', 'lithology']]
+        # Empty covering cells mean no data within the radius: skip the kd-tree
+        if self._count_in_covering_cells(target_lat, target_lon, search_radius_km) == 0:
+            nearby_idx = np.empty(0, dtype=np.intp)
+        else:
+            nearby_idx = self._nearby_indices(target_lat, target_lon, search_radius_km)
+        relevant_idx = nearby_idx[self._relevant[nearby_idx]]
+        data_density = len(relevant_idx)
         
-        data_density_risk = 0.8 if len(mineral_relevant) < 5 else 0.3 if len(mineral_relevant) < 15 else 0.1
+        data_density_risk = 0.8 if data_density < 5 else 0.3 if data_density < 15 else 0.1
         
         # 2. STRUCTURAL PLAUSIBILITY CHECK
         structural_integrity = self._check_structural_closure(
-            target_lat, target_lon, mineral, nearby_records
+            target_lat, target_lon, mineral, self._struct[nearby_idx]
         )
         
         # 3. GRADE UNCERTAINTY vs. CUTOFF
-        grade_stats = self._calculate_grade_statistics(mineral_relevant)
-        economic_cutoffs = {
-            Mineral.GOLD: 0.5,      # g/t
-            Mineral.LITHIUM: 0.1,   # % Li2O
-            Mineral.COPPER: 0.3,    # %
-        }
-        cutoff = economic_cutoffs.get(mineral, 0.5)
+        grade_stats = self._calculate_grade_statistics(self._grade[nearby_idx])
+        cutoff = _ECONOMIC_CUTOFFS.get(mineral, 0.5)
         
         if grade_stats['mean'] is not None:
             grade_probability = self._calculate_prob_exceeding_cutoff(
@@ -526,54 +712,41 @@ class GroundTruthVault:
             "risk_percent": risk_score * 100,
             "critical_failure_mode": failure_mode,
             "recommended_action": action,
-            "data_density": len(mineral_relevant),
+            "data_density": data_density,
             "structural_integrity": structural_integrity,
             "grade_probability": grade_probability,
             "confidence_90_low": ci_low * 100,
             "confidence_90_high": ci_high * 100,
-            "anchor_records": [r[0] for r in mineral_relevant[:5]],
+            "anchor_records": tuple(self._record_ids[i] for i in relevant_idx[:5]),
             "mineral_context": Mineral.GOLD.context if mineral == Mineral.GOLD else {}
         }
 
     def _check_structural_closure(self, lat: float, lon: float, 
-                                  mineral: Mineral, nearby: List) -> float:
+                                  mineral: Mineral, struct: np.ndarray) -> float:
         """
-        Validate structural plausibility.
+        Validate structural plausibility from nearby structural-control flags.
         Returns 0.0-1.0 integrity score.
         """
-        # Check for structural control indicators
-        structural_records = [r for r in nearby 
-                             if r[1].structural_control is not None]
+        structural = struct[struct >= 0]
         
-        if not structural_records:
+        if len(structural) == 0:
             return 0.5  # No structural data
         
-        favorable_controls = [r for r in structural_records 
-                             if r[1].structural_control in ['fault_zone', 'fold_hinge']]
-        
-        return len(favorable_controls) / max(len(structural_records), 1)
+        return float(structural.mean())
 
-    def _calculate_grade_statistics(self, records: List) -> Dict[str, Optional[float]]:
-        """Calculate mean and std dev of assay grades"""
-        values = []
-        for rec_id, rec in records:
-            if rec.measurement_type == 'assay_ppm' and rec.measurement_value is not None:
-                if not rec.is_non_detect:
-                    values.append(rec.measurement_value)
+    def _calculate_grade_statistics(self, grades: np.ndarray) -> Dict[str, Optional[float]]:
+        """Calculate mean and std dev of assay grades (NaN = not a detected assay)"""
+        values = grades[~np.isnan(grades)]
         
         if len(values) < 2:
             return {"mean": None, "std_dev": None, "count": len(values)}
         
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        std_dev = math.sqrt(variance)
-        
         return {
-            "mean": mean,
-            "std_dev": std_dev,
+            "mean": float(values.mean()),
+            "std_dev": float(values.std()),
             "count": len(values),
-            "min": min(values),
-            "max": max(values)
+            "min": float(values.min()),
+            "max": float(values.max())
         }
 
     def _calculate_prob_exceeding_cutoff(self, mean: float, std_dev: float, 
@@ -597,6 +770,10 @@ class GroundTruthVault:
         """Return all detected conflicts"""
         return self.conflicts
 
+    def iter_conflicting_records(self, limit: Optional[int] = None) -> Iterator[ConflictRecord]:
+        """Yield up to `limit` detected conflicts without copying the list"""
+        return islice(self.conflicts, limit)
+
     def get_mineral_specific_guidance(self, mineral: Mineral) -> Dict[str, Any]:
         """Return mineral-specific ground truth requirements"""
         return {
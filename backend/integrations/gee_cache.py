@@ -0,0 +1,189 @@
+"""
+GEE Layer Cache for Aurora OSI
+Per-location cache of GEE dataset results (in-process LRU + optional Redis)
+"""
+
+import json
+import logging
+import math
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Static layers (terrain, soil, land cover, surface water) do not change between
+# requests; optical/climate layers pick up new acquisitions, so expire sooner
+STATIC_LAYER_TTL_S = 30 * 24 * 3600
+DYNAMIC_LAYER_TTL_S = 6 * 3600
+
+# ~110 m grid cell - finer than any point-sampled layer we serve
+COORD_PRECISION = 3
+
+
+# Per-location fields stored at native precision instead of float64 JSON:
+# (key, struct code, scale, decoded type). Values that are missing, non-numeric
+# or out of range for the code stay in the JSON remainder unquantized.
+QUANTIZED_FIELDS = (
+    ("srtm_elevation_m", "h", 1, float),
+    ("gebco_elevation_m", "h", 1, float),
+    ("aster_dem_m", "h", 1, float),
+    ("slope_degrees", "h", 100, float),
+    ("soil_silt_0_5cm_pct", "H", 1, float),
+    ("water_occurrence_pct", "B", 1, float),
+    ("land_cover_class", "B", 1, int),
+    ("copernicus_lulc", "H", 1, int),
+    ("modis_lai", "B", 10, float),
+    ("lst_kelvin", "H", 50, float),
+    ("ndvi", "h", 10000, float),
+    ("ndbi", "h", 10000, float),
+    ("ndmi", "h", 10000, float),
+)
+_CODE_RANGES = {"B": (0, 255), "h": (-32768, 32767), "H": (0, 65535)}
+_CODEC_MAGIC = b"\x01"
+
+
+def encode_layer_value(value: Any) -> bytes:
+    """
+    Serialize a cached dataset result, packing QUANTIZED_FIELDS with struct.
+
+    Layout: magic, uint16 presence mask, packed fields in QUANTIZED_FIELDS
+    order, then the remaining keys as JSON.
+    """
+    if not isinstance(value, dict):
+        return json.dumps(value).encode()
+    rest = dict(value)
+    mask = 0
+    fmt = "<"
+    packed = []
+    for bit, (key, code, scale, _) in enumerate(QUANTIZED_FIELDS):
+        v = rest.get(key)
+        if isinstance(v, bool) or not isinstance(v, (int, float)) or math.isnan(v):
+            continue
+        q = round(v * scale)
+        low, high = _CODE_RANGES[code]
+        if not low <= q <= high:
+            continue
+        mask |= 1 << bit
+        fmt += code
+        packed.append(q)
+        del rest[key]
+    return _CODEC_MAGIC + struct.pack("<H", mask) + struct.pack(fmt, *packed) + json.dumps(rest).encode()
+
+
+def decode_layer_value(raw: bytes) -> Any:
+    """Inverse of encode_layer_value; plain JSON (older Redis entries) is accepted too"""
+    if raw[:1] != _CODEC_MAGIC:
+        return json.loads(raw)
+    (mask,) = struct.unpack_from("<H", raw, 1)
+    fields = [f for bit, f in enumerate(QUANTIZED_FIELDS) if mask & (1 << bit)]
+    fmt = "<" + "".join(code for _, code, _, _ in fields)
+    offset = 3 + struct.calcsize(fmt)
+    value = {}
+    for (key, _, scale, cast), q in zip(fields, struct.unpack_from(fmt, raw, 3)):
+        value[key] = cast(q / scale) if scale != 1 else cast(q)
+    value.update(json.loads(raw[offset:]))
+    return value
+
+
+def layer_cache_key(dataset: str, latitude: float, longitude: float, radius_m: int, variant: str = "") -> str:
+    """Build the cache key for a dataset at a quantized location"""
+    lat_q = round(latitude, COORD_PRECISION)
+    lon_q = round(longitude, COORD_PRECISION)
+    key = f"gee:{dataset}:{lat_q:.3f}:{lon_q:.3f}:{radius_m}"
+    return f"{key}:{variant}" if variant else key
+
+
+class GEELayerCache:
+    """
+    Two-tier cache for GEE dataset results.
+
+    Tier 1 is a bounded in-process LRU; tier 2 is Redis (when REDIS_URL is set)
+    so results survive restarts and are shared across uvicorn workers. Both
+    tiers hold encode_layer_value bytes, decoded on read.
+    """
+
+    def __init__(self, maxsize: int = 4096, redis_url: Optional[str] = None):
+        self.maxsize = maxsize
+        self._local: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis_url = redis_url or os.getenv("REDIS_URL")
+        self._redis = None
+        self._redis_failed = False
+
+    @property
+    def remote(self) -> bool:
+        """True when reads/writes may hit Redis (blocking network I/O)"""
+        return bool(self._redis_url) and not self._redis_failed
+
+    def _get_redis(self):
+        """Connect to Redis on first use; give up for the process after one failure"""
+        if self._redis is not None or self._redis_failed or not self._redis_url:
+            return self._redis
+        try:
+            import redis
+            self._redis = redis.from_url(self._redis_url, socket_connect_timeout=1, socket_timeout=1)
+            self._redis.ping()
+            logger.info("✓ GEE layer cache connected to Redis")
+        except Exception as e:
+            logger.warning(f"⚠️ GEE layer cache running without Redis: {str(e)[:50]}")
+            self._redis = None
+            self._redis_failed = True
+        return self._redis
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on miss/expiry"""
+        now = time.time()
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                expires_at, raw = entry
+                if expires_at > now:
+                    self._local.move_to_end(key)
+                    return decode_layer_value(raw)
+                del self._local[key]
+
+        r = self._get_redis()
+        if r is None:
+            return None
+        try:
+            raw = r.get(key)
+            if raw is None:
+                return None
+            ttl = r.ttl(key)
+            self._set_local(key, raw, ttl if ttl and ttl > 0 else DYNAMIC_LAYER_TTL_S)
+            return decode_layer_value(raw)
+        except Exception as e:
+            logger.warning(f"⚠️ GEE layer cache read failed: {str(e)[:50]}")
+            return None
+
+    def set(self, key: str, value: Any, ttl_s: int) -> None:
+        """Store value under key in both tiers"""
+        raw = encode_layer_value(value)
+        self._set_local(key, raw, ttl_s)
+        r = self._get_redis()
+        if r is None:
+            return
+        try:
+            r.setex(key, ttl_s, raw)
+        except Exception as e:
+            logger.warning(f"⚠️ GEE layer cache write failed: {str(e)[:50]}")
+
+    def _set_local(self, key: str, raw: bytes, ttl_s: int) -> None:
+        with self._lock:
+            self._local[key] = (time.time() + ttl_s, raw)
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (Redis entries expire on their own TTL)"""
+        with self._lock:
+            self._local.clear()
+
+
+# Shared instance used by gee_integration
+layer_cache = GEELayerCache()
@@ -3,27 +3,879 @@ Google Earth Engine Integration for Aurora OSI
 Real Sentinel-2 satellite data fetching for subsurface analysis
 """
 
-import ee
+import functools
 import logging
+import math
 import os
-from typing import Dict, Optional, List, Any
+import random
+import threading
+import time
+from typing import Dict, Optional, List, Any, AsyncIterator, Callable, Tuple
 from datetime import datetime, timedelta
 import json
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
+from enum import Enum
+
+from .gee_cache import layer_cache, layer_cache_key, STATIC_LAYER_TTL_S, DYNAMIC_LAYER_TTL_S
 
 logger = logging.getLogger(__name__)
 
+class GEEErrorCode(str, Enum):
+    """Values of the "code" field in failed GEEIntegration responses"""
+    NO_CREDENTIALS = "NO_CREDENTIALS"
+    FILE_NOT_FOUND = "FILE_NOT_FOUND"
+    INIT_ERROR = "INIT_ERROR"
+    GEE_ERROR = "GEE_ERROR"
+    NO_POINTS = "NO_POINTS"
+    NO_DATA_AVAILABLE = "NO_DATA_AVAILABLE"
+    DEM_ERROR = "DEM_ERROR"
+    INDEX_ERROR = "INDEX_ERROR"
+    EXPORT_UNAVAILABLE = "EXPORT_UNAVAILABLE"
+    EXPORT_ERROR = "EXPORT_ERROR"
+    TASK_NOT_FOUND = "TASK_NOT_FOUND"
+
+
+# earthengine-api is heavy to import; it is loaded by GEEIntegration.initialize()
+# and every ee.* call below runs only after a successful initialize
+ee = None
+
+
+def _load_ee():
+    """Import earthengine-api on first use and bind it to the module global"""
+    global ee
+    if ee is None:
+        import ee as ee_module
+        ee = ee_module
+    return ee
+
+
+# High-volume endpoint is built for many concurrent requests (vs. the default
+# interactive endpoint), which is what the parallel dataset fetch issues
+GEE_HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+GEE_FETCH_MAX_WORKERS = 16
+# Per-dataset retry on transient GEE errors (quota/overload), and the wall-time
+# budget for one fetch_sentinel2_data call (datasets run in parallel)
+GEE_FETCH_RETRIES = 3
+GEE_FETCH_TIMEOUT_S = 30
+_TRANSIENT_GEE_ERRORS = ("429", "Too Many Requests", "503", "Service Unavailable", "Deadline", "timed out")
+# One pooled HTTPS session serves every fetch thread, so TLS handshakes are
+# paid once per pooled connection rather than once per getInfo()
+GEE_HTTP_POOL_SIZE = 32
+GEE_CLIENT_RETRIES = 3
+
+
+class _PooledHttp:
+    """
+    httplib2-compatible transport for ee.Initialize backed by a requests.Session.
+
+    The default transport is a single httplib2.Http, which is neither pooled nor
+    safe to share across the fetch pool's threads; urllib3's pool is both.
+    """
+
+    redirect_codes = frozenset((300, 301, 302, 303, 307, 308))
+
+    def __init__(self, pool_size: int = GEE_HTTP_POOL_SIZE, timeout: float = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=GEE_CLIENT_RETRIES
+        ))
+        self.timeout = timeout
+        self.connections: Dict[str, Any] = {}
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None, **kwargs):
+        import httplib2
+        response = self.session.request(
+            method, uri, data=body, headers=headers,
+            timeout=self.timeout, allow_redirects=redirections > 0
+        )
+        info = {key.lower(): value for key, value in response.headers.items()}
+        info["status"] = str(response.status_code)
+        return httplib2.Response(info), response.content
+
+    def close(self):
+        self.session.close()
+
+# reduceRegion pixel budget: sized from the ROI. Regional means over ROIs past
+# the ceiling are split into quadtree tiles (see _reduce_tiled); GEE is only
+# asked to downsample once TILE_MAX_DEPTH is exhausted
+MAX_PIXELS_CEILING = int(1e8)
+MAX_PIXELS_SAFETY_FACTOR = 1.3
+TILE_MAX_DEPTH = 5
+
+
+def _pixel_budget(area_m2: float, scale: float) -> Dict[str, Any]:
+    """Return maxPixels/bestEffort kwargs for reduceRegion over an area at a scale"""
+    expected = area_m2 / (scale * scale)
+    max_pixels = max(1, int(expected * MAX_PIXELS_SAFETY_FACTOR))
+    kwargs: Dict[str, Any] = {"maxPixels": max_pixels}
+    if max_pixels > MAX_PIXELS_CEILING:
+        kwargs["maxPixels"] = MAX_PIXELS_CEILING
+        kwargs["bestEffort"] = True
+    logger.debug(f"Pixel budget: expected={expected:.0f} scale={scale}m -> {kwargs}")
+    return kwargs
+
+
+def _roi(point, radius_m: float):
+    """
+    Query region around a point: the bounding box of the radius_m buffer.
+
+    A 5-vertex rectangle serializes and intersects far cheaper than the
+    ~64-vertex circle approximation buffer() produces.
+    """
+    return point.buffer(radius_m).bounds()
+
+
+def _roi_area_m2(radius_m: float) -> float:
+    """Area of the _roi box for radius_m"""
+    return (2 * radius_m) ** 2
+
+
+def _radius_pixel_budget(radius_m: float, scale: float) -> Dict[str, Any]:
+    """Pixel budget for the _roi box of radius_m"""
+    return _pixel_budget(_roi_area_m2(radius_m), scale)
+
+
+# Past this many 10 m pixels in the ROI, mode="auto" fetches go through a batch
+# table export (no interactive 5 min / response-size cap) instead of getInfo()
+EXPORT_PIXEL_THRESHOLD = 10_000_000
+GEE_EXPORT_BUCKET_ENV = "GEE_EXPORT_BUCKET"
+
+
+def _tile_levels(area_m2: float, scale: float) -> int:
+    """Quadsplit depth needed so each tile of the area fits under MAX_PIXELS_CEILING"""
+    tile_pixels = area_m2 / (scale * scale) * MAX_PIXELS_SAFETY_FACTOR
+    levels = 0
+    while tile_pixels > MAX_PIXELS_CEILING and levels < TILE_MAX_DEPTH:
+        tile_pixels /= 4
+        levels += 1
+    return levels
+
+
+def _quad_tiles(roi, levels: int) -> List[Any]:
+    """Split the ROI bounds into a 2^levels x 2^levels grid, each clipped to the ROI"""
+    ring = ee.List(roi.bounds().coordinates().get(0))
+    west = ee.Number(ee.List(ring.get(0)).get(0))
+    south = ee.Number(ee.List(ring.get(0)).get(1))
+    east = ee.Number(ee.List(ring.get(2)).get(0))
+    north = ee.Number(ee.List(ring.get(2)).get(1))
+    n = 2 ** levels
+    dx = east.subtract(west).divide(n)
+    dy = north.subtract(south).divide(n)
+    return [
+        ee.Geometry.Rectangle([
+            west.add(dx.multiply(i)), south.add(dy.multiply(j)),
+            west.add(dx.multiply(i + 1)), south.add(dy.multiply(j + 1))
+        ]).intersection(roi, 1)
+        for i in range(n)
+        for j in range(n)
+    ]
+
+
+def _reduce_tiled(image, roi, scale: int, area_m2: float) -> Dict[str, Any]:
+    """
+    Per-band mean of image over the ROI without truncating large ROIs.
+
+    ROIs that fit the pixel budget take a single reduceRegion. Larger ones are
+    quadsplit (CubeXpress-style), the tiles reduced in parallel, and the tile
+    means merged weighted by their pixel counts.
+    """
+    levels = _tile_levels(area_m2, scale)
+    if levels == 0:
+        return image.reduceRegion(
+            reducer=ee.Reducer.mean(),
+            geometry=roi,
+            scale=scale,
+            **_pixel_budget(area_m2, scale)
+        ).getInfo()
+
+    tiles = _quad_tiles(roi, levels)
+    tile_budget = _pixel_budget(area_m2 / len(tiles), scale)
+    reducer = ee.Reducer.mean().combine(ee.Reducer.count(), sharedInputs=True)
+
+    def _reduce_tile(tile):
+        return image.reduceRegion(reducer=reducer, geometry=tile, scale=scale, **tile_budget).getInfo()
+
+    sums: Dict[str, float] = {}
+    counts: Dict[str, float] = {}
+    for partial in _GEE_TILE_POOL.map(_reduce_tile, tiles):
+        for key, value in partial.items():
+            if not key.endswith("_mean") or value is None:
+                continue
+            band = key[:-len("_mean")]
+            count = partial.get(f"{band}_count") or 0
+            sums[band] = sums.get(band, 0.0) + value * count
+            counts[band] = counts.get(band, 0) + count
+
+    logger.info(f"✓ Reduced {len(tiles)} tiles at {scale}m")
+    return {band: (sums[band] / counts[band] if counts[band] else None) for band in sums}
+
+
+def _geojson_area_m2(geometry: Dict) -> float:
+    """Approximate area of a GeoJSON geometry from its lon/lat bounding box"""
+    coords: List[List[float]] = []
+
+    def _collect(node):
+        if isinstance(node, (list, tuple)) and node and isinstance(node[0], (int, float)):
+            coords.append(node)
+        elif isinstance(node, (list, tuple)):
+            for child in node:
+                _collect(child)
+
+    _collect(geometry.get("coordinates", []))
+    if not coords:
+        return 0.0
+    lons = [c[0] for c in coords]
+    lats = [c[1] for c in coords]
+    mid_lat = math.radians((min(lats) + max(lats)) / 2)
+    width_m = (max(lons) - min(lons)) * 111320.0 * math.cos(mid_lat)
+    height_m = (max(lats) - min(lats)) * 110540.0
+    return abs(width_m * height_m)
+
+
+# ===== PER-DATASET FETCHERS =====
+# Each fetcher issues its own GEE round-trips and returns the parameters it
+# collected (empty dict when the dataset has no coverage). They are independent,
+# so fetch_sentinel2_data runs them concurrently on a thread pool.
+
+def _is_transient_error(error: BaseException) -> bool:
+    """True for GEE errors worth retrying (rate limit, overload, deadline)"""
+    message = str(error)
+    return any(marker in message for marker in _TRANSIENT_GEE_ERRORS)
+
+
+def gee_task(name: str, retries: int = GEE_FETCH_RETRIES):
+    """
+    Register a fetcher as one dataset of fetch_sentinel2_data.
+
+    Logs the fetch and retries transient errors with exponential back-off
+    (1s, 2s, 4s + jitter); anything else propagates to the caller on the
+    first failure. The display name is kept on the wrapper as dataset_name.
+    """
+    def decorator(fetcher):
+        @functools.wraps(fetcher)
+        def wrapper(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+            logger.info(f"📡 {name}...")
+            for attempt in range(retries + 1):
+                try:
+                    return fetcher(roi, point, radius_m, max_cloud_cover)
+                except Exception as e:
+                    if attempt == retries or not _is_transient_error(e):
+                        raise
+                    delay = 2 ** attempt + random.random()
+                    logger.warning(f"⚠️ {name}: {str(e)[:50]} - retry {attempt + 1}/{retries} in {delay:.1f}s")
+                    time.sleep(delay)
+        wrapper.dataset_name = name
+        return wrapper
+    return decorator
+
+
+LAND_COVER_NAMES = {
+    10: "Tree cover",
+    20: "Shrubland",
+    30: "Herbaceous",
+    40: "Cropland",
+    50: "Built-up",
+    60: "Barren",
+    70: "Snow/ice",
+    80: "Open water",
+    90: "Herbaceous wetland",
+    95: "Mangroves",
+    100: "Moss/lichen"
+}
+
+
+def _first_image_stats(collection, bands: List[str], roi, scale: int, radius_m: int):
+    """
+    Count a collection and reduce its first image over the ROI in one round-trip.
+
+    Returns:
+        (image_count, stats) - stats is empty when the collection is empty
+    """
+    size = collection.size()
+    area_m2 = _roi_area_m2(radius_m)
+    if _tile_levels(area_m2, scale) > 0:
+        count = size.getInfo()
+        if count == 0:
+            return 0, {}
+        image = ee.Image(collection.first()).select(bands).float().clip(roi)
+        return count, _reduce_tiled(image, roi, scale, area_m2)
+
+    stats = ee.Algorithms.If(
+        size.gt(0),
+        ee.Image(collection.first()).select(bands).float().clip(roi).reduceRegion(
+            reducer=ee.Reducer.mean(),
+            geometry=roi,
+            scale=scale,
+            **_radius_pixel_budget(radius_m, scale)
+        ),
+        ee.Dictionary({})
+    )
+    result = ee.Dictionary({'count': size, 'stats': stats}).getInfo()
+    return result['count'], result['stats']
+
+
+def _point_values_if_any(collection, image, point, scale: int) -> Dict[str, Any]:
+    """
+    Reduce image at the point, skipping server-side when the collection is empty.
+
+    One round-trip either way; masked bands come back as None.
+    """
+    values = ee.Algorithms.If(
+        collection.size().gt(0),
+        ee.Image(image).reduceRegion(
+            reducer=ee.Reducer.firstNonNull(),
+            geometry=point,
+            scale=scale
+        ),
+        ee.Dictionary({})
+    )
+    return ee.Dictionary(values).getInfo()
+
+
+SENTINEL2_BANDS = ['B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A', 'B11', 'B12']
+
+
+def _s2_first_image(roi, max_cloud_cover: float):
+    """Least-cloudy Sentinel-2 image over the ROI and the matching image count (server-side)"""
+    s2_collection = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED") \
+        .filterBounds(roi) \
+        .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", max_cloud_cover * 100)) \
+        .sort("CLOUDY_PIXEL_PERCENTAGE")
+    return ee.Image(s2_collection.first()), s2_collection.size()
+
+
+@gee_task("Sentinel-2")
+def _fetch_sentinel2(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """1 + 9. Sentinel-2 band means and NDVI/NDBI/NDMI from one shared image"""
+    s2_image, count = _s2_first_image(roi, max_cloud_cover)
+    has_image = count.gt(0)
+    band_image = s2_image.select(SENTINEL2_BANDS).float().clip(roi)
+    area_m2 = _roi_area_m2(radius_m)
+    tiled = _tile_levels(area_m2, 10) > 0
+    fused = ee.Dictionary({
+        'count': count,
+        # Tiled ROIs are reduced separately below, once we know there is an image
+        'bands': ee.Dictionary({}) if tiled else ee.Algorithms.If(
+            has_image,
+            band_image.reduceRegion(
+                reducer=ee.Reducer.mean(),
+                geometry=roi,
+                scale=10,
+                **_pixel_budget(area_m2, 10)
+            ),
+            ee.Dictionary({})
+        ),
+        'indices': ee.Algorithms.If(
+            has_image,
+            _vegetation_index_image(s2_image).reduceRegion(reducer=ee.Reducer.firstNonNull(), geometry=point, scale=10),
+            ee.Dictionary({})
+        )
+    }).getInfo()
+    if fused['count'] == 0:
+        return {}
+    if tiled:
+        fused['bands'] = _reduce_tiled(band_image, roi, 10, area_m2)
+    result = {'sentinel2_bands': fused['bands']}
+    result.update({
+        name: float(value)
+        for name, value in fused['indices'].items()
+        if value is not None
+    })
+    logger.info(f"✓ Sentinel-2: {fused['count']} images")
+    return result
+
+
+@gee_task("Landsat")
+def _fetch_landsat_bands(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """2. Landsat 8/9 (30m resolution, multispectral)"""
+    ls_collection = ee.ImageCollection("LANDSAT/LC09/C02/T1_L2") \
+        .filterBounds(roi) \
+        .filter(ee.Filter.lt("CLOUD_COVER", max_cloud_cover * 100)) \
+        .sort("CLOUD_COVER")
+
+    count_ls, ls_stats = _first_image_stats(
+        ls_collection,
+        ['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7'],
+        roi, 30, radius_m
+    )
+    if count_ls == 0:
+        return {}
+    logger.info(f"✓ Landsat: {count_ls} images")
+    return {'landsat_bands': ls_stats}
+
+
+@gee_task("MODIS")
+def _fetch_modis_bands(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """3. MODIS (250m resolution, good temporal coverage)"""
+    modis = ee.ImageCollection("MODIS/061/MOD09GA") \
+        .filterBounds(roi) \
+        .filter(ee.Filter.lt("CLOUD_COVER", max_cloud_cover * 100))
+
+    count_modis, modis_stats = _first_image_stats(
+        modis,
+        ['sur_refl_b01', 'sur_refl_b02', 'sur_refl_b03', 'sur_refl_b04', 'sur_refl_b05', 'sur_refl_b06', 'sur_refl_b07'],
+        roi, 250, radius_m
+    )
+    if count_modis == 0:
+        return {}
+    logger.info(f"✓ MODIS: {count_modis} images")
+    return {'modis_bands': modis_stats}
+
+
+@gee_task("Sentinel-1")
+def _fetch_sentinel1_sar(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """4. Sentinel-1 SAR (penetrates clouds, all-weather)"""
+    sar_collection = ee.ImageCollection("COPERNICUS/S1_GRD") \
+        .filterBounds(roi) \
+        .filter(ee.Filter.eq('instrumentMode', 'IW'))
+
+    count_sar, sar_stats = _first_image_stats(sar_collection, ['VV', 'VH'], roi, 10, radius_m)
+    if count_sar == 0:
+        return {}
+    logger.info(f"✓ Sentinel-1: {count_sar} images")
+    return {'sar_vh_vv': sar_stats}
+
+
+@gee_task("ALOS PALSAR")
+def _fetch_palsar(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """5. ALOS PALSAR (L-band SAR, penetrates vegetation)"""
+    palsar = ee.ImageCollection("JAXA/ALOS/PALSAR/YEARLY/SAR") \
+        .filterBounds(roi)
+
+    count_palsar, palsar_stats = _first_image_stats(palsar, ['HH', 'HV'], roi, 25, radius_m)
+    if count_palsar == 0:
+        return {}
+    logger.info(f"✓ ALOS PALSAR: {count_palsar} images")
+    return {'palsar_hh_hv': palsar_stats}
+
+
+def _fetch_srtm(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """6. SRTM DEM (global 30m) plus derived slope"""
+    logger.info("📡 SRTM DEM...")
+    result = {}
+    srtm = ee.Image("USGS/SRTMGL1_Ellip/SRTMGL1_Ellip_srtm")
+    # Elevation and derived slope sampled together in one round-trip
+    terrain = srtm.addBands(ee.Terrain.slope(srtm))
+    sample = terrain.sample(point, scale=30).getInfo()
+    if sample.get("features"):
+        props = sample["features"][0]["properties"]
+        elev = props.get("elevation", None)
+        slope_val = props.get("slope", None)
+        result['srtm_elevation_m'] = float(elev) if elev is not None else None
+        result['slope_degrees'] = float(slope_val) if slope_val is not None else None
+        logger.info(f"✓ SRTM DEM")
+    return result
+
+
+def _fetch_gebco(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """7. GEBCO Bathymetry/Topography (global)"""
+    logger.info("📡 GEBCO...")
+    gebco = ee.Image("GEBCO/2023")
+    topo = gebco.sample(point, scale=100).getInfo()
+    if not topo.get("features"):
+        return {}
+    topo_val = topo["features"][0]["properties"].get("elevation", None)
+    logger.info(f"✓ GEBCO")
+    return {'gebco_elevation_m': float(topo_val) if topo_val is not None else None}
+
+
+def _fetch_aster_dem(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """8. ASTER DEM (15m resolution, global)"""
+    logger.info("📡 ASTER DEM...")
+    aster_dem = ee.Image("USGS/ASTGTM/V003")
+    dem = aster_dem.select(['elevation']).sample(point, scale=30).getInfo()
+    if not dem.get("features"):
+        return {}
+    dem_val = dem["features"][0]["properties"].get("elevation", None)
+    logger.info(f"✓ ASTER DEM")
+    return {'aster_dem_m': float(dem_val) if dem_val is not None else None}
+
+
+def _static_point_stack():
+    """Static point layers as one image, bands named after their output keys"""
+    srtm = ee.Image("USGS/SRTMGL1_Ellip/SRTMGL1_Ellip_srtm")
+    return ee.Image.cat([
+        srtm.select([0]).rename('srtm_elevation_m'),
+        ee.Terrain.slope(srtm).rename('slope_degrees'),
+        ee.Image("GEBCO/2023").select(['elevation']).rename('gebco_elevation_m'),
+        ee.Image("USGS/ASTGTM/V003").select(['elevation']).rename('aster_dem_m'),
+        ee.Image("projects/soilgrids-isric/soilgrids2.0/prediction_mean/silt_mean_0-5cm_2017").select([0]).rename('soil_silt_0_5cm_pct'),
+        ee.Image("JRC/GSW1_3/GlobalSurfaceWater").select(['occurrence']).rename('water_occurrence_pct'),
+    ])
+
+
+def _vegetation_index_image(img):
+    """NDVI / NDBI / NDMI of a Sentinel-2 image as one three-band image"""
+    return img.normalizedDifference(['B8', 'B4']).rename('ndvi') \
+        .addBands(img.normalizedDifference(['B11', 'B8']).rename('ndbi')) \
+        .addBands(img.normalizedDifference(['B8', 'B11']).rename('ndmi'))
+
+
+@gee_task("Static layers")
+def _fetch_static_point_layers(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """
+    SRTM (+slope), GEBCO, ASTER, SoilGrids and JRC water sampled in one round-trip.
+
+    The layers are single images with point semantics, so they are stacked into
+    one multi-band image (bands named after the output keys) and reduced once.
+    If the stacked request fails, each layer is fetched on its own so one bad
+    asset does not drop the others.
+    """
+    stacked = _static_point_stack()
+    try:
+        values = stacked.reduceRegion(reducer=ee.Reducer.firstNonNull(), geometry=point, scale=30).getInfo()
+    except Exception as e:
+        logger.warning(f"⚠️ Stacked static layers failed, fetching individually: {str(e)[:50]}")
+        result = {}
+        for fetcher in (_fetch_srtm, _fetch_gebco, _fetch_aster_dem, _fetch_soilgrids, _fetch_surface_water):
+            try:
+                result.update(fetcher(roi, point, radius_m, max_cloud_cover))
+            except Exception as layer_err:
+                logger.warning(f"⚠️ {fetcher.__name__}: {str(layer_err)[:50]}")
+        return result
+
+    result = {key: float(value) for key, value in values.items() if value is not None}
+    logger.info(f"✓ Static layers: {len(result)} values")
+    return result
+
+
+@gee_task("MODIS LAI")
+def _fetch_modis_lai(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """10. MODIS LAI (Leaf Area Index)"""
+    lai = ee.ImageCollection("MODIS/061/MCD15A3H") \
+        .filterBounds(roi)
+
+    result = {}
+    lai_val = _point_values_if_any(lai, lai.first().select(['Lai']), point, 500)
+    if lai_val.get('Lai') is not None:
+        result['modis_lai'] = float(lai_val['Lai']) / 10.0
+    logger.info(f"✓ MODIS LAI")
+    return result
+
+
+@gee_task("ESA WorldCover")
+def _fetch_worldcover(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """11. ESA WorldCover (10m land cover classification)"""
+    worldcover = ee.ImageCollection("ESA/WorldCover/v200") \
+        .filterBounds(roi)
+
+    result = {}
+    lc_val = _point_values_if_any(worldcover, worldcover.first().select(['Map']), point, 10)
+    if lc_val.get('Map') is not None:
+        lc_class = int(lc_val['Map'])
+        result['land_cover_class'] = lc_class
+        result['land_cover_type'] = LAND_COVER_NAMES.get(lc_class, "Unknown")
+    logger.info(f"✓ ESA WorldCover")
+    return result
+
+
+@gee_task("Copernicus LULC")
+def _fetch_copernicus_lulc(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """12. Copernicus Land Cover (100m)"""
+    lulc = ee.ImageCollection("COPERNICUS/CORINE/V20/100m") \
+        .filterBounds(roi)
+
+    result = {}
+    lulc_val = _point_values_if_any(lulc, lulc.first(), point, 100)
+    if lulc_val.get('classification') is not None:
+        result['copernicus_lulc'] = int(lulc_val['classification'])
+    logger.info(f"✓ Copernicus LULC")
+    return result
+
+
+@gee_task("MODIS LST")
+def _fetch_modis_lst(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """13. MODIS Land Surface Temperature"""
+    lst = ee.ImageCollection("MODIS/061/MOD11A1") \
+        .filterBounds(roi)
+
+    result = {}
+    temp_val = _point_values_if_any(lst, lst.first().select(['LST_Day_1km']), point, 1000)
+    if temp_val.get('LST_Day_1km') is not None:
+        # MODIS LST is in Kelvin * 0.02
+        result['lst_kelvin'] = float(temp_val['LST_Day_1km']) * 0.02
+    logger.info(f"✓ MODIS LST")
+    return result
+
+
+@gee_task("ERA5")
+def _fetch_era5(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """14. ERA5 Climate Data (temperature, precipitation)"""
+    era5 = ee.ImageCollection("ECMWF/ERA5_LAND/MONTHLY_AGGR") \
+        .filterBounds(roi)
+
+    result = {}
+    climate_data = _point_values_if_any(era5, era5.first(), point, 11132)
+    if climate_data.get('temperature_2m') is not None:
+        result['era5_temp_2m_k'] = float(climate_data['temperature_2m'])
+    if climate_data.get('precipitation') is not None:
+        result['era5_precipitation_mm'] = float(climate_data['precipitation'])
+    logger.info(f"✓ ERA5 Climate")
+    return result
+
+
+def _fetch_soilgrids(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """15. SoilGrids data"""
+    logger.info("📡 SoilGrids...")
+    result = {}
+    soilgrids = ee.Image("projects/soilgrids-isric/soilgrids2.0/prediction_mean/silt_mean_0-5cm_2017")
+    soil_val = soilgrids.sample(point, scale=250).getInfo()
+    if soil_val.get("features"):
+        result['soil_silt_0_5cm_pct'] = float(soil_val["features"][0]["properties"].get("prediction_mean", 0))
+    logger.info(f"✓ SoilGrids")
+    return result
+
+
+def _fetch_surface_water(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """16. Permanent Water (JRC surface water)"""
+    logger.info("📡 Water indices...")
+    result = {}
+    water = ee.Image("JRC/GSW1_3/GlobalSurfaceWater")
+    occurrence = water.select(['occurrence']).sample(point, scale=30).getInfo()
+    if occurrence.get("features"):
+        result['water_occurrence_pct'] = float(occurrence["features"][0]["properties"].get("occurrence", 0))
+    logger.info(f"✓ Water data")
+    return result
+
+
+@gee_task("CHIRPS")
+def _fetch_chirps(roi, point, radius_m: int, max_cloud_cover: float) -> Dict[str, Any]:
+    """17. CHIRPS Rainfall"""
+    chirps = ee.ImageCollection("UCSB-CHG/CHIRPS-DAILY") \
+        .filterBounds(roi) \
+        .select(['precipitation'])
+
+    result = {}
+    precip = _point_values_if_any(chirps, chirps.mean(), point, 5000)
+    if precip.get('precipitation') is not None:
+        result['chirps_mean_precipitation_mm'] = float(precip['precipitation'])
+    logger.info(f"✓ CHIRPS")
+    return result
+
+
+def _is_auth_error(error: BaseException) -> bool:
+    """True for GEE errors caused by an expired or rejected session (HTTP 401)"""
+    message = str(error)
+    return "401" in message or "UNAUTHENTICATED" in message or "invalid_grant" in message
+
+
+# (display name, fetcher) in response order
+DATASET_FETCHERS = tuple((fetcher.dataset_name, fetcher) for fetcher in (
+    # ===== OPTICAL IMAGERY =====
+    _fetch_sentinel2,
+    _fetch_landsat_bands,
+    _fetch_modis_bands,
+    # ===== RADAR DATA =====
+    _fetch_sentinel1_sar,
+    _fetch_palsar,
+    # ===== TOPOGRAPHY, SOIL & WATER (single stacked sample) =====
+    _fetch_static_point_layers,
+    # ===== VEGETATION =====
+    _fetch_modis_lai,
+    # ===== LAND COVER =====
+    _fetch_worldcover,
+    _fetch_copernicus_lulc,
+    # ===== CLIMATE & WEATHER =====
+    _fetch_modis_lst,
+    _fetch_era5,
+    # ===== RAINFALL =====
+    _fetch_chirps,
+))
+
+# Layers that do not change between acquisitions - cached for STATIC_LAYER_TTL_S
+STATIC_FETCHERS = frozenset({
+    _fetch_static_point_layers,
+    _fetch_copernicus_lulc,
+    _fetch_worldcover,
+})
+
+
+# Shared by the sync and async fetch paths; threads are spawned on demand
+_GEE_FETCH_POOL = ThreadPoolExecutor(max_workers=GEE_FETCH_MAX_WORKERS, thread_name_prefix="gee-fetch")
+# Separate pool for _reduce_tiled: it is called from fetch-pool threads, and
+# waiting on tiles queued behind those same threads could deadlock
+_GEE_TILE_POOL = ThreadPoolExecutor(max_workers=GEE_FETCH_MAX_WORKERS, thread_name_prefix="gee-tile")
+
+
+# Fetches currently running, by dataset cache key: concurrent requests for the
+# same dataset/location share one GEE call instead of issuing duplicates
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.RLock()  # done-callbacks can fire inside submit
+
+
+def _submit_dataset(entry, roi, point, radius_m: int, max_cloud_cover: float) -> Future:
+    """Run a pending (name, fetcher, cache_key) on the fetch pool, joining an identical in-flight fetch"""
+    _, fetcher, cache_key = entry
+    with _inflight_lock:
+        future = _inflight.get(cache_key)
+        if future is None:
+            future = _GEE_FETCH_POOL.submit(fetcher, roi, point, radius_m, max_cloud_cover)
+            _inflight[cache_key] = future
+            future.add_done_callback(functools.partial(_release_inflight, cache_key))
+        else:
+            logger.info(f"✓ {entry[0]}: joined in-flight fetch")
+    return future
+
+
+async def _await_dataset(entry, roi, point, radius_m: int, max_cloud_cover: float):
+    """Await one pending dataset fetch, bounded by GEE_FETCH_TIMEOUT_S"""
+    return await asyncio.wait_for(
+        # shield: a timed-out caller must not cancel a fetch other requests joined
+        asyncio.shield(asyncio.wrap_future(_submit_dataset(entry, roi, point, radius_m, max_cloud_cover))),
+        GEE_FETCH_TIMEOUT_S
+    )
+
+
+def _release_inflight(cache_key: str, future: Future) -> None:
+    with _inflight_lock:
+        if _inflight.get(cache_key) is future:
+            del _inflight[cache_key]
+
+
+def _dataset_cache_key(fetcher, latitude: float, longitude: float, radius_m: int, max_cloud_cover: float) -> str:
+    """Cache key for one dataset; dynamic layers also vary by cloud-cover filter"""
+    dataset = fetcher.__name__[len("_fetch_"):]
+    variant = "" if fetcher in STATIC_FETCHERS else f"cc{max_cloud_cover}"
+    return layer_cache_key(dataset, latitude, longitude, radius_m, variant)
+
+
+async def _cache_call(fn, *args):
+    """Run a layer-cache helper from a coroutine; Redis round-trips go to a worker thread"""
+    if layer_cache.remote:
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+
+# ===== MULTI-POINT BATCH =====
+# The batch path reduces every point in one reduceRegions call per layer.
+# Collections are mosaicked over the union of the points (a single first()
+# image may not cover all of them); bands are renamed/scaled server-side to
+# the same output keys the single-point path produces.
+
+@dataclass
+class BatchLayer:
+    """One reduceRegions call in fetch_sentinel2_batch"""
+    name: str
+    image: Any
+    scale: int
+    regional: bool                 # mean over the buffered ROI vs. value at the point
+    nest_key: Optional[str] = None  # group values under this key (e.g. 'sentinel2_bands')
+    postprocess: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+
+
+def _land_cover_values(values: Dict[str, Any]) -> Dict[str, Any]:
+    lc_class = int(values['land_cover_class'])
+    return {'land_cover_class': lc_class, 'land_cover_type': LAND_COVER_NAMES.get(lc_class, "Unknown")}
+
+
+def _batch_layers(region, max_cloud_cover: float) -> List[BatchLayer]:
+    """Server-side images for every dataset of fetch_sentinel2_data, for region"""
+    def coll(asset_id):
+        return ee.ImageCollection(asset_id).filterBounds(region)
+
+    s2 = coll("COPERNICUS/S2_SR_HARMONIZED") \
+        .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", max_cloud_cover * 100)) \
+        .sort("CLOUDY_PIXEL_PERCENTAGE", False) \
+        .mosaic()  # least cloudy image ends up on top
+    landsat = coll("LANDSAT/LC09/C02/T1_L2") \
+        .filter(ee.Filter.lt("CLOUD_COVER", max_cloud_cover * 100)) \
+        .sort("CLOUD_COVER", False) \
+        .mosaic()
+    modis = coll("MODIS/061/MOD09GA").filter(ee.Filter.lt("CLOUD_COVER", max_cloud_cover * 100)).mosaic()
+    return [
+        BatchLayer("Sentinel-2", s2.select(SENTINEL2_BANDS).float(),
+                   10, True, 'sentinel2_bands'),
+        BatchLayer("Landsat", landsat.select(['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7']).float(),
+                   30, True, 'landsat_bands'),
+        BatchLayer("MODIS", modis.select(['sur_refl_b01', 'sur_refl_b02', 'sur_refl_b03', 'sur_refl_b04', 'sur_refl_b05', 'sur_refl_b06', 'sur_refl_b07']).float(),
+                   250, True, 'modis_bands'),
+        BatchLayer("Sentinel-1", coll("COPERNICUS/S1_GRD").filter(ee.Filter.eq('instrumentMode', 'IW')).select(['VV', 'VH']).mosaic(),
+                   10, True, 'sar_vh_vv'),
+        BatchLayer("ALOS PALSAR", coll("JAXA/ALOS/PALSAR/YEARLY/SAR").select(['HH', 'HV']).mosaic().float(),
+                   25, True, 'palsar_hh_hv'),
+        BatchLayer("Static layers", _static_point_stack(), 30, False),
+        BatchLayer("Vegetation indices", _vegetation_index_image(s2), 10, False),
+        BatchLayer("MODIS LAI", coll("MODIS/061/MCD15A3H").select(['Lai']).mosaic().multiply(0.1).rename('modis_lai'),
+                   500, False),
+        BatchLayer("ESA WorldCover", coll("ESA/WorldCover/v200").select(['Map']).mosaic().rename('land_cover_class'),
+                   10, False, postprocess=_land_cover_values),
+        BatchLayer("Copernicus LULC", coll("COPERNICUS/CORINE/V20/100m").select(['classification']).mosaic().rename('copernicus_lulc'),
+                   100, False, postprocess=lambda v: {'copernicus_lulc': int(v['copernicus_lulc'])}),
+        BatchLayer("MODIS LST", coll("MODIS/061/MOD11A1").select(['LST_Day_1km']).mosaic().multiply(0.02).rename('lst_kelvin'),
+                   1000, False),
+        BatchLayer("ERA5", coll("ECMWF/ERA5_LAND/MONTHLY_AGGR").select(['temperature_2m', 'precipitation']).mosaic()
+                   .rename(['era5_temp_2m_k', 'era5_precipitation_mm']), 11132, False),
+        BatchLayer("CHIRPS", coll("UCSB-CHG/CHIRPS-DAILY").select(['precipitation']).mean().rename('chirps_mean_precipitation_mm'),
+                   5000, False),
+    ]
+
+
+def _reduce_batch_layer(layer: BatchLayer, point_fc, roi_fc) -> Dict[int, Dict[str, Any]]:
+    """Reduce one layer over all points in a single round-trip; returns {point_id: values}"""
+    fc = roi_fc if layer.regional else point_fc
+    base = ee.Reducer.mean() if layer.regional else ee.Reducer.firstNonNull()
+    # forEachBand keeps band names as output properties, even for single-band images
+    features = layer.image.reduceRegions(
+        collection=fc,
+        reducer=base.forEachBand(layer.image),
+        scale=layer.scale
+    ).getInfo()["features"]
+
+    per_point: Dict[int, Dict[str, Any]] = {}
+    for feature in features:
+        props = dict(feature["properties"])
+        point_id = int(props.pop("id"))
+        values = {key: value for key, value in props.items() if value is not None}
+        if not values:
+            continue
+        if layer.postprocess:
+            values = layer.postprocess(values)
+        per_point[point_id] = {layer.nest_key: values} if layer.nest_key else values
+    return per_point
+
+
+def _export_table(layers: List[BatchLayer], point_fc, roi_fc):
+    """
+    One FeatureCollection with every layer's values as properties, for Export.
+
+    Regional layers are reduced over the ROI boxes first; the features are then
+    moved to the box centroid (the query point) for the point-sampled layers.
+    nest_key/postprocess are client-side, so exported properties are raw band names.
+    """
+    fc = roi_fc
+    for layer in (l for l in layers if l.regional):
+        fc = layer.image.reduceRegions(collection=fc, reducer=ee.Reducer.mean().forEachBand(layer.image), scale=layer.scale)
+    fc = fc.map(lambda f: f.setGeometry(f.geometry().centroid(1)))
+    for layer in (l for l in layers if not l.regional):
+        fc = layer.image.reduceRegions(collection=fc, reducer=ee.Reducer.firstNonNull().forEachBand(layer.image), scale=layer.scale)
+    return fc
+
 
 class GEEIntegration:
     """Manages Google Earth Engine authentication and data fetching"""
     
     _initialized = False
     _credentials_path = None
+    _creds_json = None
+    _ee = None
+    _init_lock = threading.Lock()
     
     @classmethod
     def initialize(cls, credentials_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Initialize Google Earth Engine with service account credentials.
         
+        The earthengine-api import is deferred to here so routes that never
+        touch GEE don't pay for it; the lock keeps concurrent first requests
+        from initializing twice. The service-account JSON is parsed once and
+        kept on the class, so re-initializing does not go back to disk.
+        
         Args:
             credentials_path: Path to GEE service account JSON file
                             If None, uses environment variable: GEE_CREDENTIALS
@@ -31,51 +883,82 @@ class GEEIntegration:
         Returns:
             {success: bool, message: str, error: str}
         """
-        try:
-            if cls._initialized:
-                logger.info("✓ GEE already initialized")
-                return {"success": True, "message": "GEE already initialized"}
-            
-            # Get credentials path
-            creds_path = credentials_path or os.getenv("GEE_CREDENTIALS")
-            
-            if not creds_path:
-                logger.error("❌ No GEE credentials provided")
+        with cls._init_lock:
+            try:
+                if cls._initialized:
+                    logger.info("✓ GEE already initialized")
+                    return {"success": True, "message": "GEE already initialized"}
+                
+                # Get credentials path
+                creds_path = credentials_path or os.getenv("GEE_CREDENTIALS")
+                
+                if not creds_path:
+                    logger.error("❌ No GEE credentials provided")
+                    return {
+                        "success": False,
+                        "error": "GEE_CREDENTIALS environment variable not set",
+                        "code": GEEErrorCode.NO_CREDENTIALS.value
+                    }
+                
+                if cls._creds_json is None or creds_path != cls._credentials_path:
+                    # Check if file exists
+                    if not os.path.exists(creds_path):
+                        logger.error(f"❌ Credentials file not found: {creds_path}")
+                        return {
+                            "success": False,
+                            "error": f"Credentials file not found: {creds_path}",
+                            "code": GEEErrorCode.FILE_NOT_FOUND.value
+                        }
+                    with open(creds_path) as f:
+                        cls._creds_json = json.load(f)
+                    cls._credentials_path = creds_path
+                
+                cls._ee = _load_ee()
+                
+                # Authenticate with service account credentials
+                credentials = ee.ServiceAccountCredentials(
+                    cls._creds_json['client_email'],
+                    key_data=json.dumps(cls._creds_json)
+                )
+                ee.Initialize(
+                    credentials,
+                    opt_url=GEE_HIGH_VOLUME_URL,
+                    http_transport=_PooledHttp(timeout=GEE_FETCH_TIMEOUT_S)
+                )
+                ee.data.setDeadline(GEE_FETCH_TIMEOUT_S * 1000)
+                if hasattr(ee.data, "setMaxRetries"):
+                    ee.data.setMaxRetries(GEE_CLIENT_RETRIES)
+                
+                cls._initialized = True
+                
+                logger.info("✓ Google Earth Engine initialized successfully")
                 return {
-                    "success": False,
-                    "error": "GEE_CREDENTIALS environment variable not set",
-                    "code": "NO_CREDENTIALS"
+                    "success": True,
+                    "message": "Google Earth Engine authenticated"
                 }
-            
-            # Check if file exists
-            if not os.path.exists(creds_path):
-                logger.error(f"❌ Credentials file not found: {creds_path}")
+                
+            except Exception as e:
+                logger.error(f"❌ GEE initialization error: {str(e)}")
                 return {
                     "success": False,
-                    "error": f"Credentials file not found: {creds_path}",
-                    "code": "FILE_NOT_FOUND"
+                    "error": str(e),
+                    "code": GEEErrorCode.INIT_ERROR.value
                 }
-            
-            # Authenticate with service account credentials
-            credentials = ee.ServiceAccountCredentials.from_authorized_user_file(creds_path)
-            ee.Initialize(credentials)
-            
-            cls._initialized = True
-            cls._credentials_path = creds_path
-            
-            logger.info("✓ Google Earth Engine initialized successfully")
-            return {
-                "success": True,
-                "message": "Google Earth Engine authenticated"
-            }
-            
-        except Exception as e:
-            logger.error(f"❌ GEE initialization error: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "code": "INIT_ERROR"
-            }
+    
+    @classmethod
+    def reinitialize(cls, force: bool = True) -> Dict[str, Any]:
+        """
+        Re-run ee.Initialize from the cached credentials.
+        
+        Args:
+            force: Re-initialize even if GEE is already initialized
+                   (e.g. after the session token was rejected)
+        """
+        if force:
+            with cls._init_lock:
+                cls._initialized = False
+            logger.info("🔐 Re-initializing Google Earth Engine")
+        return cls.initialize(cls._credentials_path)
     
     @classmethod
     def fetch_sentinel2_data(
@@ -85,7 +968,8 @@ class GEEIntegration:
         radius_m: int = 5000,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        max_cloud_cover: float = 0.5
+        max_cloud_cover: float = 0.5,
+        mode: str = "auto"
     ) -> Dict[str, Any]:
         """
         Fetch ALL available satellite/geophysical data from GEE for a location.
@@ -110,6 +994,9 @@ class GEEIntegration:
             start_date: Optional - only used for recent time-series queries
             end_date: Optional - only used for recent time-series queries
             max_cloud_cover: Maximum acceptable cloud cover (0-1, default: 50%)
+            mode: "interactive" (inline stats), "batch" (export task, see
+                  export_sentinel2_data) or "auto" (batch only for ROIs over
+                  EXPORT_PIXEL_THRESHOLD when an export bucket is configured)
         
         Returns:
             {
@@ -122,386 +1009,481 @@ class GEEIntegration:
             }
         """
         try:
-            if not cls._initialized:
-                init_result = cls.initialize()
-                if not init_result.get("success"):
-                    return init_result
-            
-            logger.info(f"🛰️ Fetching ALL available satellite data for ({latitude}, {longitude})")
-            
-            # Create point geometry
-            point = ee.Geometry.Point([longitude, latitude])
-            roi = point.buffer(radius_m)
-            
-            collected_data = {}
-            
-            # ===== OPTICAL IMAGERY =====
-            
-            # 1. Sentinel-2 (10m resolution, multispectral)
-            try:
-                logger.info("📡 Sentinel-2 (optical)...")
-                s2_collection = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED") \
-                    .filterBounds(roi) \
-                    .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", max_cloud_cover * 100)) \
-                    .sort("CLOUDY_PIXEL_PERCENTAGE")
-                
-                count_s2 = s2_collection.size().getInfo()
-                if count_s2 > 0:
-                    s2_image = s2_collection.first()
-                    s2_bands = s2_image.select(['B1', 'B2', 'B3', 'B4', 'B5', 'B6', 'B7', 'B8', 'B8A', 'B11', 'B12']).float().clip(roi)
-                    s2_stats = s2_bands.reduceRegion(
-                        reducer=ee.Reducer.mean(),
-                        geometry=roi,
-                        scale=10,
-                        maxPixels=1e6
-                    ).getInfo()
-                    collected_data['sentinel2_bands'] = s2_stats
-                    logger.info(f"✓ Sentinel-2: {count_s2} images")
-            except Exception as e:
-                logger.warning(f"⚠️ Sentinel-2: {str(e)[:50]}")
-            
-            # 2. Landsat 8/9 (30m resolution, multispectral)
-            try:
-                logger.info("📡 Landsat 8/9...")
-                ls_collection = ee.ImageCollection("LANDSAT/LC09/C02/T1_L2") \
-                    .filterBounds(roi) \
-                    .filter(ee.Filter.lt("CLOUD_COVER", max_cloud_cover * 100)) \
-                    .sort("CLOUD_COVER")
-                
-                count_ls = ls_collection.size().getInfo()
-                if count_ls > 0:
-                    ls_image = ls_collection.first()
-                    ls_bands = ls_image.select(['SR_B1', 'SR_B2', 'SR_B3', 'SR_B4', 'SR_B5', 'SR_B6', 'SR_B7']).float().clip(roi)
-                    ls_stats = ls_bands.reduceRegion(
-                        reducer=ee.Reducer.mean(),
-                        geometry=roi,
-                        scale=30,
-                        maxPixels=1e6
-                    ).getInfo()
-                    collected_data['landsat_bands'] = ls_stats
-                    logger.info(f"✓ Landsat: {count_ls} images")
-            except Exception as e:
-                logger.warning(f"⚠️ Landsat: {str(e)[:50]}")
+            use_export = cls._use_export(mode, radius_m)
+            if not use_export:
+                results, pending = cls._lookup_cached_datasets(latitude, longitude, radius_m, max_cloud_cover)
+                if not pending:
+                    # Every layer is cached - answer without initializing or calling Earth Engine
+                    return cls._dataset_response(results, latitude, longitude, radius_m)
             
-            # 3. MODIS (250m resolution, good temporal coverage)
-            try:
-                logger.info("📡 MODIS...")
-                modis = ee.ImageCollection("MODIS/061/MOD09GA") \
-                    .filterBounds(roi) \
-                    .filter(ee.Filter.lt("CLOUD_COVER", max_cloud_cover * 100))
-                
-                count_modis = modis.size().getInfo()
-                if count_modis > 0:
-                    modis_img = modis.first()
-                    modis_bands = modis_img.select(['sur_refl_b01', 'sur_refl_b02', 'sur_refl_b03', 'sur_refl_b04', 'sur_refl_b05', 'sur_refl_b06', 'sur_refl_b07']).float().clip(roi)
-                    modis_stats = modis_bands.reduceRegion(
-                        reducer=ee.Reducer.mean(),
-                        geometry=roi,
-                        scale=250,
-                        maxPixels=1e6
-                    ).getInfo()
-                    collected_data['modis_bands'] = modis_stats
-                    logger.info(f"✓ MODIS: {count_modis} images")
-            except Exception as e:
-                logger.warning(f"⚠️ MODIS: {str(e)[:50]}")
-            
-            # ===== RADAR DATA =====
-            
-            # 4. Sentinel-1 SAR (penetrates clouds, all-weather)
-            try:
-                logger.info("📡 Sentinel-1 SAR...")
-                sar_collection = ee.ImageCollection("COPERNICUS/S1_GRD") \
-                    .filterBounds(roi) \
-                    .filter(ee.Filter.eq('instrumentMode', 'IW'))
-                
-                count_sar = sar_collection.size().getInfo()
-                if count_sar > 0:
-                    sar_image = sar_collection.first()
-                    sar_bands = sar_image.select(['VV', 'VH']).clip(roi)
-                    sar_stats = sar_bands.reduceRegion(
-                        reducer=ee.Reducer.mean(),
-                        geometry=roi,
-                        scale=10,
-                        maxPixels=1e6
-                    ).getInfo()
-                    collected_data['sar_vh_vv'] = sar_stats
-                    logger.info(f"✓ Sentinel-1: {count_sar} images")
-            except Exception as e:
-                logger.warning(f"⚠️ Sentinel-1: {str(e)[:50]}")
-            
-            # 5. ALOS PALSAR (L-band SAR, penetrates vegetation)
-            try:
-                logger.info("📡 ALOS PALSAR...")
-                palsar = ee.ImageCollection("JAXA/ALOS/PALSAR/YEARLY/SAR") \
-                    .filterBounds(roi) \
-                    .select(['HH', 'HV'])
-                
-                count_palsar = palsar.size().getInfo()
-                if count_palsar > 0:
-                    palsar_img = palsar.first()
-                    palsar_stats = palsar_img.clip(roi).reduceRegion(
-                        reducer=ee.Reducer.mean(),
-                        geometry=roi,
-                        scale=25,
-                        maxPixels=1e6
-                    ).getInfo()
-                    collected_data['palsar_hh_hv'] = palsar_stats
-                    logger.info(f"✓ ALOS PALSAR: {count_palsar} images")
-            except Exception as e:
-                logger.warning(f"⚠️ ALOS PALSAR: {str(e)[:50]}")
+            response, geometry = cls._begin_fetch(latitude, longitude, radius_m, max_cloud_cover, use_export)
+            if response is not None:
+                return response
+            roi, point = geometry
             
-            # ===== TOPOGRAPHY & ELEVATION =====
-            
-            # 6. SRTM DEM (global 30m)
+            # Each dataset is an independent blocking RPC chain, so run them
+            # concurrently; wall time tracks the slowest dataset, not the sum
+            futures = {
+                _submit_dataset(entry, roi, point, radius_m, max_cloud_cover): entry
+                for entry in pending
+            }
+            remaining = set(futures)
             try:
-                logger.info("📡 SRTM DEM...")
-                srtm = ee.Image("USGS/SRTMGL1_Ellip/SRTMGL1_Ellip_srtm")
-                elevation = srtm.sample(point, scale=30).getInfo()
-                if elevation.get("features"):
-                    elev = elevation["features"][0]["properties"].get("elevation", None)
-                    collected_data['srtm_elevation_m'] = float(elev) if elev is not None else None
-                    # Also compute slope
-                    slope = ee.Terrain.slope(srtm).sample(point, scale=30).getInfo()
-                    if slope.get("features"):
-                        slope_val = slope["features"][0]["properties"].get("slope", None)
-                        collected_data['slope_degrees'] = float(slope_val) if slope_val is not None else None
-                    logger.info(f"✓ SRTM DEM")
-            except Exception as e:
-                logger.warning(f"⚠️ SRTM DEM: {str(e)[:50]}")
+                for future in as_completed(futures, timeout=GEE_FETCH_TIMEOUT_S):
+                    remaining.discard(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        outcome = e
+                    cls._record_dataset(results, futures[future], outcome)
+            except FuturesTimeoutError:
+                for future in remaining:
+                    cls._record_dataset(
+                        results, futures[future],
+                        TimeoutError(f"no response after {GEE_FETCH_TIMEOUT_S}s")
+                    )
             
-            # 7. GEBCO Bathymetry/Topography (global)
-            try:
-                logger.info("📡 GEBCO...")
-                gebco = ee.Image("GEBCO/2023")
-                topo = gebco.sample(point, scale=100).getInfo()
-                if topo.get("features"):
-                    topo_val = topo["features"][0]["properties"].get("elevation", None)
-                    collected_data['gebco_elevation_m'] = float(topo_val) if topo_val is not None else None
-                    logger.info(f"✓ GEBCO")
-            except Exception as e:
-                logger.warning(f"⚠️ GEBCO: {str(e)[:50]}")
+            return cls._dataset_response(results, latitude, longitude, radius_m)
             
-            # 8. ASTER DEM (15m resolution, global)
-            try:
-                logger.info("📡 ASTER DEM...")
-                aster = ee.Image("ASTER/AST_L1T_003/003_01_20150101T000000")
-                aster_dem = ee.Image("USGS/ASTGTM/V003")
-                dem = aster_dem.select(['elevation']).sample(point, scale=30).getInfo()
-                if dem.get("features"):
-                    dem_val = dem["features"][0]["properties"].get("elevation", None)
-                    collected_data['aster_dem_m'] = float(dem_val) if dem_val is not None else None
-                    logger.info(f"✓ ASTER DEM")
-            except Exception as e:
-                logger.warning(f"⚠️ ASTER DEM: {str(e)[:50]}")
+        except Exception as e:
+            return cls._fetch_error("GEE data fetch error", e)
+    
+    @classmethod
+    async def fetch_sentinel2_data_async(
+        cls,
+        latitude: float,
+        longitude: float,
+        radius_m: int = 5000,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_cloud_cover: float = 0.5,
+        mode: str = "auto"
+    ) -> Dict[str, Any]:
+        """
+        Async variant of fetch_sentinel2_data for FastAPI routes.
+        
+        The blocking getInfo() chains run on the shared GEE thread pool and are
+        awaited together, so the event loop keeps serving other requests while
+        GEE responds. Same arguments and response shape as the sync method;
+        only the wait differs, the cache/init/export steps are shared.
+        """
+        try:
+            use_export = cls._use_export(mode, radius_m)
+            if not use_export:
+                results, pending = await _cache_call(
+                    cls._lookup_cached_datasets, latitude, longitude, radius_m, max_cloud_cover
+                )
+                if not pending:
+                    return cls._dataset_response(results, latitude, longitude, radius_m)
             
-            # ===== VEGETATION & INDICES =====
+            response, geometry = await asyncio.to_thread(
+                cls._begin_fetch, latitude, longitude, radius_m, max_cloud_cover, use_export
+            )
+            if response is not None:
+                return response
+            roi, point = geometry
             
-            # 9. NDVI (Normalized Difference Vegetation Index)
-            try:
-                logger.info("📡 Vegetation indices...")
-                s2_collection = ee.ImageCollection("COPERNICUS/S2_SR_HARMONIZED") \
-                    .filterBounds(roi) \
-                    .filter(ee.Filter.lt("CLOUDY_PIXEL_PERCENTAGE", max_cloud_cover * 100))
-                
-                if s2_collection.size().getInfo() > 0:
-                    img = s2_collection.first()
-                    ndvi = img.normalizedDifference(['B8', 'B4'])
-                    ndbi = img.normalizedDifference(['B11', 'B8'])  # Normalized Difference Built-up Index
-                    ndmi = img.normalizedDifference(['B8', 'B11'])  # Normalized Difference Moisture Index
-                    
-                    ndvi_val = ndvi.sample(point, scale=10).getInfo()
-                    ndbi_val = ndbi.sample(point, scale=10).getInfo()
-                    ndmi_val = ndmi.sample(point, scale=10).getInfo()
-                    
-                    if ndvi_val.get("features"):
-                        collected_data['ndvi'] = float(ndvi_val["features"][0]["properties"].get("nd", 0))
-                    if ndbi_val.get("features"):
-                        collected_data['ndbi'] = float(ndbi_val["features"][0]["properties"].get("nd", 0))
-                    if ndmi_val.get("features"):
-                        collected_data['ndmi'] = float(ndmi_val["features"][0]["properties"].get("nd", 0))
-                    logger.info(f"✓ Vegetation indices")
-            except Exception as e:
-                logger.warning(f"⚠️ Vegetation indices: {str(e)[:50]}")
+            outcomes = await asyncio.gather(
+                *(_await_dataset(entry, roi, point, radius_m, max_cloud_cover) for entry in pending),
+                return_exceptions=True
+            )
+            for entry, outcome in zip(pending, outcomes):
+                await _cache_call(cls._record_dataset, results, entry, outcome)
             
-            # 10. MODIS LAI (Leaf Area Index)
-            try:
-                logger.info("📡 MODIS LAI...")
-                lai = ee.ImageCollection("MODIS/061/MCD15A3H") \
-                    .filterBounds(roi)
-                
-                if lai.size().getInfo() > 0:
-                    lai_img = lai.first().select(['Lai'])
-                    lai_val = lai_img.sample(point, scale=500).getInfo()
-                    if lai_val.get("features"):
-                        collected_data['modis_lai'] = float(lai_val["features"][0]["properties"].get("Lai", 0)) / 10.0
-                    logger.info(f"✓ MODIS LAI")
-            except Exception as e:
-                logger.warning(f"⚠️ MODIS LAI: {str(e)[:50]}")
+            return cls._dataset_response(results, latitude, longitude, radius_m)
             
-            # ===== LAND COVER =====
+        except Exception as e:
+            return cls._fetch_error("GEE data fetch error", e)
+    
+    @classmethod
+    async def stream_sentinel2_data(
+        cls,
+        latitude: float,
+        longitude: float,
+        radius_m: int = 5000,
+        max_cloud_cover: float = 0.5
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield fetch_sentinel2_data results one dataset at a time, as they arrive.
+        
+        Cached datasets are yielded first, then each GEE fetch as it completes,
+        so a slow dataset (e.g. ERA5) no longer holds back the fast ones. GEE
+        is only initialized when some dataset is not cached.
+        
+        Yields:
+            {dataset: str, bands: {...}, cached: bool} per dataset with data,
+            or a single {success: False, error, code} if GEE cannot be used
+        """
+        try:
+            results, pending = await _cache_call(
+                cls._lookup_cached_datasets, latitude, longitude, radius_m, max_cloud_cover
+            )
+            for name, values in results.items():
+                if values:
+                    yield {"dataset": name, "bands": values, "cached": True}
+            if not pending:
+                # Every layer is cached - no Earth Engine init or geometry needed
+                return
             
-            # 11. ESA WorldCover (10m land cover classification)
-            try:
-                logger.info("📡 ESA WorldCover...")
-                worldcover = ee.ImageCollection("ESA/WorldCover/v200") \
-                    .filterBounds(roi)
-                
-                if worldcover.size().getInfo() > 0:
-                    wc = worldcover.first()
-                    lc_val = wc.sample(point, scale=10).getInfo()
-                    if lc_val.get("features"):
-                        lc_class = int(lc_val["features"][0]["properties"].get("Map", 0))
-                        lc_names = {
-                            10: "Tree cover",
-                            20: "Shrubland",
-                            30: "Herbaceous",
-                            40: "Cropland",
-                            50: "Built-up",
-                            60: "Barren",
-                            70: "Snow/ice",
-                            80: "Open water",
-                            90: "Herbaceous wetland",
-                            95: "Mangroves",
-                            100: "Moss/lichen"
-                        }
-                        collected_data['land_cover_class'] = lc_class
-                        collected_data['land_cover_type'] = lc_names.get(lc_class, "Unknown")
-                    logger.info(f"✓ ESA WorldCover")
-            except Exception as e:
-                logger.warning(f"⚠️ ESA WorldCover: {str(e)[:50]}")
+            response, geometry = await asyncio.to_thread(
+                cls._begin_fetch, latitude, longitude, radius_m, max_cloud_cover, False
+            )
+            if response is not None:
+                yield response
+                return
+            roi, point = geometry
             
-            # 12. Copernicus Land Cover (100m)
-            try:
-                logger.info("📡 Copernicus LULC...")
-                lulc = ee.ImageCollection("COPERNICUS/CORINE/V20/100m") \
-                    .filterBounds(roi)
-                
-                if lulc.size().getInfo() > 0:
-                    lulc_img = lulc.first()
-                    lulc_val = lulc_img.sample(point, scale=100).getInfo()
-                    if lulc_val.get("features"):
-                        collected_data['copernicus_lulc'] = int(lulc_val["features"][0]["properties"].get("classification", 0))
-                    logger.info(f"✓ Copernicus LULC")
-            except Exception as e:
-                logger.warning(f"⚠️ Copernicus LULC: {str(e)[:50]}")
+            async def _run(entry):
+                try:
+                    return entry, await _await_dataset(entry, roi, point, radius_m, max_cloud_cover)
+                except Exception as e:
+                    return entry, e
             
-            # ===== CLIMATE & WEATHER =====
+            for next_done in asyncio.as_completed([_run(entry) for entry in pending]):
+                entry, outcome = await next_done
+                await _cache_call(cls._record_dataset, results, entry, outcome)
+                if outcome and not isinstance(outcome, BaseException):
+                    yield {"dataset": entry[0], "bands": outcome, "cached": False}
             
-            # 13. MODIS Land Surface Temperature
-            try:
-                logger.info("📡 MODIS Temperature...")
-                lst = ee.ImageCollection("MODIS/061/MOD11A1") \
-                    .filterBounds(roi)
-                
-                if lst.size().getInfo() > 0:
-                    lst_img = lst.first().select(['LST_Day_1km'])
-                    temp_val = lst_img.sample(point, scale=1000).getInfo()
-                    if temp_val.get("features"):
-                        # MODIS LST is in Kelvin * 0.02
-                        collected_data['lst_kelvin'] = float(temp_val["features"][0]["properties"].get("LST_Day_1km", 0)) * 0.02
-                    logger.info(f"✓ MODIS LST")
-            except Exception as e:
-                logger.warning(f"⚠️ MODIS LST: {str(e)[:50]}")
+        except Exception as e:
+            yield cls._fetch_error("GEE stream error", e)
+    
+    @classmethod
+    def _begin_fetch(
+        cls,
+        latitude: float,
+        longitude: float,
+        radius_m: int,
+        max_cloud_cover: float,
+        use_export: bool
+    ):
+        """
+        Blocking setup shared by the fetch paths once the cache has misses:
+        initialize GEE, run the export when requested, build the geometry.
+        
+        Returns:
+            (response, None) when the request is answered here (init failure
+            or export task), otherwise (None, (roi, point))
+        """
+        if not cls._initialized:
+            init_result = cls.initialize()
+            if not init_result.get("success"):
+                return init_result, None
+        
+        if use_export:
+            return cls.export_sentinel2_data(latitude, longitude, radius_m, max_cloud_cover), None
+        
+        logger.info(f"🛰️ Fetching satellite data for ({latitude}, {longitude})")
+        point = ee.Geometry.Point([longitude, latitude])
+        return None, (_roi(point, radius_m), point)
+    
+    @staticmethod
+    def _fetch_error(context: str, e: Exception) -> Dict[str, Any]:
+        """Log a failed fetch with its traceback and build the error response"""
+        logger.exception(f"❌ {context}: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e),
+            "code": GEEErrorCode.GEE_ERROR.value
+        }
+    
+    @staticmethod
+    def _use_export(mode: str, radius_m: int) -> bool:
+        """Whether a fetch should go through export_sentinel2_data"""
+        if mode == "batch":
+            return True
+        if mode != "auto" or (2 * radius_m) ** 2 / (10 * 10) <= EXPORT_PIXEL_THRESHOLD:
+            return False
+        if not os.getenv(GEE_EXPORT_BUCKET_ENV):
+            logger.warning(f"⚠️ Large ROI ({radius_m}m) but {GEE_EXPORT_BUCKET_ENV} not set - fetching interactively")
+            return False
+        return True
+    
+    @classmethod
+    def export_sentinel2_data(
+        cls,
+        latitude: float,
+        longitude: float,
+        radius_m: int = 5000,
+        max_cloud_cover: float = 0.5
+    ) -> Dict[str, Any]:
+        """
+        Start a batch export of the fetch_sentinel2_data parameters for a location.
+        
+        Large ROIs exceed the interactive getInfo() limits (~5 min, tens of MB),
+        so the reductions run as an Export.table.toCloudStorage task instead.
+        Poll it with poll_task(task_id).
+        
+        Returns:
+            {
+                success: bool,
+                data: {task_id, state, state_url, destination, metadata},
+                error: str (if failed)
+            }
+        """
+        try:
+            bucket = os.getenv(GEE_EXPORT_BUCKET_ENV)
+            if not bucket:
+                return {
+                    "success": False,
+                    "error": f"{GEE_EXPORT_BUCKET_ENV} environment variable not set",
+                    "code": GEEErrorCode.EXPORT_UNAVAILABLE.value
+                }
             
-            # 14. ERA5 Climate Data (temperature, precipitation)
-            try:
-                logger.info("📡 ERA5 Climate...")
-                era5 = ee.ImageCollection("ECMWF/ERA5_LAND/MONTHLY_AGGR") \
-                    .filterBounds(roi)
-                
-                if era5.size().getInfo() > 0:
-                    era5_img = era5.first()
-                    climate_data = era5_img.sample(point, scale=11132).getInfo()
-                    if climate_data.get("features"):
-                        props = climate_data["features"][0]["properties"]
-                        if 'temperature_2m' in props:
-                            collected_data['era5_temp_2m_k'] = float(props['temperature_2m'])
-                        if 'precipitation' in props:
-                            collected_data['era5_precipitation_mm'] = float(props['precipitation'])
-                    logger.info(f"✓ ERA5 Climate")
-            except Exception as e:
-                logger.warning(f"⚠️ ERA5: {str(e)[:50]}")
+            if not cls._initialized:
+                init_result = cls.initialize()
+                if not init_result.get("success"):
+                    return init_result
             
-            # ===== SOIL & GEOLOGY =====
+            point_fc = ee.FeatureCollection([ee.Feature(ee.Geometry.Point([longitude, latitude]), {'id': 0})])
+            roi_fc = point_fc.map(lambda f: f.buffer(radius_m).bounds())
+            layers = _batch_layers(roi_fc.geometry(), max_cloud_cover)
             
-            # 15. SoilGrids data
-            try:
-                logger.info("📡 SoilGrids...")
-                soilgrids = ee.Image("projects/soilgrids-isric/soilgrids2.0/prediction_mean/silt_mean_0-5cm_2017")
-                soil_val = soilgrids.sample(point, scale=250).getInfo()
-                if soil_val.get("features"):
-                    collected_data['soil_silt_0_5cm_pct'] = float(soil_val["features"][0]["properties"].get("prediction_mean", 0))
-                logger.info(f"✓ SoilGrids")
-            except Exception as e:
-                logger.warning(f"⚠️ SoilGrids: {str(e)[:50]}")
+            prefix = f"aurora/gee/{latitude:.4f}_{longitude:.4f}_{radius_m}_{datetime.now():%Y%m%d%H%M%S}"
+            task = ee.batch.Export.table.toCloudStorage(
+                collection=_export_table(layers, point_fc, roi_fc),
+                description=f"aurora_gee_{radius_m}m",
+                bucket=bucket,
+                fileNamePrefix=prefix,
+                fileFormat="GeoJSON"
+            )
+            task.start()
             
-            # ===== WATER =====
+            logger.info(f"✓ Started GEE export task {task.id} for ({latitude}, {longitude}), radius {radius_m}m")
+            return {
+                "success": True,
+                "mode": "batch",
+                "data": {
+                    "task_id": task.id,
+                    "state": "READY",
+                    "state_url": f"/gee/tasks/{task.id}",
+                    "destination": f"gs://{bucket}/{prefix}.geojson",
+                    "metadata": {
+                        "latitude": latitude,
+                        "longitude": longitude,
+                        "radius_m": radius_m,
+                        "query_date": datetime.now().isoformat()
+                    }
+                }
+            }
             
-            # 16. Permanent Water (JRC surface water)
-            try:
-                logger.info("📡 Water indices...")
-                water = ee.Image("JRC/GSW1_3/GlobalSurfaceWater")
-                occurrence = water.select(['occurrence']).sample(point, scale=30).getInfo()
-                if occurrence.get("features"):
-                    collected_data['water_occurrence_pct'] = float(occurrence["features"][0]["properties"].get("occurrence", 0))
-                logger.info(f"✓ Water data")
-            except Exception as e:
-                logger.warning(f"⚠️ Water: {str(e)[:50]}")
+        except Exception as e:
+            logger.error(f"❌ GEE export error: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e),
+                "code": GEEErrorCode.EXPORT_ERROR.value
+            }
+    
+    @classmethod
+    def poll_task(cls, task_id: str) -> Dict[str, Any]:
+        """
+        Check the state of a batch export started by export_sentinel2_data.
+        
+        Returns:
+            {success: bool, data: {task_id, state, description, destination_uris, error_message}, error: str}
+        """
+        try:
+            if not cls._initialized:
+                init_result = cls.initialize()
+                if not init_result.get("success"):
+                    return init_result
             
-            # ===== RAINFALL =====
+            status = ee.data.getTaskStatus(task_id)[0]
+            if status.get("state") == "UNKNOWN":
+                return {
+                    "success": False,
+                    "error": f"Unknown GEE task: {task_id}",
+                    "code": GEEErrorCode.TASK_NOT_FOUND.value
+                }
             
-            # 17. CHIRPS Rainfall
-            try:
-                logger.info("📡 CHIRPS rainfall...")
-                chirps = ee.ImageCollection("UCSB-CHG/CHIRPS-DAILY") \
-                    .filterBounds(roi) \
-                    .select(['precipitation'])
-                
-                if chirps.size().getInfo() > 0:
-                    chirps_mean = chirps.mean()
-                    precip = chirps_mean.sample(point, scale=5000).getInfo()
-                    if precip.get("features"):
-                        collected_data['chirps_mean_precipitation_mm'] = float(precip["features"][0]["properties"].get("precipitation", 0))
-                    logger.info(f"✓ CHIRPS")
-            except Exception as e:
-                logger.warning(f"⚠️ CHIRPS: {str(e)[:50]}")
+            return {
+                "success": True,
+                "data": {
+                    "task_id": task_id,
+                    "state": status.get("state"),
+                    "description": status.get("description"),
+                    "destination_uris": status.get("destination_uris", []),
+                    "error_message": status.get("error_message")
+                }
+            }
             
-            # Check if we got ANY data
-            if not collected_data:
-                logger.error("❌ No satellite data available from any source")
+        except Exception as e:
+            logger.error(f"❌ GEE task status error: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e),
+                "code": GEEErrorCode.GEE_ERROR.value
+            }
+    
+    @classmethod
+    def fetch_sentinel2_batch(
+        cls,
+        points: List[Tuple[float, float]],
+        radius_m: int = 5000,
+        max_cloud_cover: float = 0.5
+    ) -> Dict[str, Any]:
+        """
+        Fetch the fetch_sentinel2_data parameters for many locations at once.
+        
+        All points go into one ee.FeatureCollection and each dataset is reduced
+        with a single reduceRegions call, so the number of GEE round-trips is
+        per dataset rather than per dataset per point.
+        
+        Args:
+            points: [(latitude, longitude), ...]
+            radius_m: Search radius in meters for the regional (band mean) datasets
+            max_cloud_cover: Maximum acceptable cloud cover (0-1)
+        
+        Returns:
+            {
+                success: bool,
+                data: {
+                    points: [{latitude, longitude, bands: {...}}, ...],
+                    metadata: {query info}
+                },
+                error: str (if failed)
+            }
+        """
+        try:
+            if not points:
                 return {
                     "success": False,
-                    "error": "No satellite data available from any GEE source for this location",
-                    "code": "NO_DATA_AVAILABLE"
+                    "error": "No points provided",
+                    "code": GEEErrorCode.NO_POINTS.value
                 }
             
-            logger.info(f"✓ Retrieved data from {len(collected_data)} parameters/sources")
+            if not cls._initialized:
+                init_result = cls.initialize()
+                if not init_result.get("success"):
+                    return init_result
+            
+            logger.info(f"🛰️ Fetching satellite data for {len(points)} points in batch")
+            
+            point_fc = ee.FeatureCollection([
+                ee.Feature(ee.Geometry.Point([lon, lat]), {'id': i})
+                for i, (lat, lon) in enumerate(points)
+            ])
+            roi_fc = point_fc.map(lambda f: f.buffer(radius_m).bounds())
+            layers = _batch_layers(roi_fc.geometry(), max_cloud_cover)
+            
+            bands_by_point: List[Dict[str, Any]] = [{} for _ in points]
+            futures = {
+                _GEE_FETCH_POOL.submit(_reduce_batch_layer, layer, point_fc, roi_fc): layer.name
+                for layer in layers
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    per_point = future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ {name} (batch): {str(e)[:50]}")
+                    continue
+                for point_id, values in per_point.items():
+                    bands_by_point[point_id].update(values)
+                logger.info(f"✓ {name}: {len(per_point)}/{len(points)} points")
             
             return {
                 "success": True,
                 "data": {
-                    "bands": collected_data,
+                    "points": [
+                        {"latitude": lat, "longitude": lon, "bands": bands}
+                        for (lat, lon), bands in zip(points, bands_by_point)
+                    ],
                     "metadata": {
-                        "latitude": latitude,
-                        "longitude": longitude,
+                        "point_count": len(points),
                         "radius_m": radius_m,
-                        "parameters_count": len(collected_data),
-                        "parameters": list(collected_data.keys()),
+                        "datasets": [layer.name for layer in layers],
                         "query_date": datetime.now().isoformat()
                     }
                 }
             }
             
         except Exception as e:
-            logger.error(f"❌ GEE data fetch error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"❌ GEE batch fetch error: {str(e)}")
             return {
                 "success": False,
                 "error": str(e),
-                "code": "GEE_ERROR"
+                "code": GEEErrorCode.GEE_ERROR.value
             }
+    
+    @staticmethod
+    def _lookup_cached_datasets(
+        latitude: float,
+        longitude: float,
+        radius_m: int,
+        max_cloud_cover: float
+    ):
+        """
+        Serve repeat locations from the layer cache; only misses hit GEE.
+        
+        Returns:
+            (results by dataset name, [(name, fetcher, cache_key) still to fetch])
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        for name, fetcher in DATASET_FETCHERS:
+            cache_key = _dataset_cache_key(fetcher, latitude, longitude, radius_m, max_cloud_cover)
+            cached = layer_cache.get(cache_key)
+            if cached is not None:
+                results[name] = cached
+            else:
+                pending.append((name, fetcher, cache_key))
+        if len(pending) < len(DATASET_FETCHERS):
+            logger.info(f"✓ Layer cache: {len(DATASET_FETCHERS) - len(pending)}/{len(DATASET_FETCHERS)} datasets cached")
+        return results, pending
+    
+    @staticmethod
+    def _record_dataset(results: Dict[str, Dict[str, Any]], entry, outcome) -> None:
+        """Store one fetcher outcome (values or the exception it raised) and cache successes"""
+        name, fetcher, cache_key = entry
+        if isinstance(outcome, BaseException):
+            logger.warning(f"⚠️ {name}: {str(outcome)[:50]}")
+            if _is_auth_error(outcome):
+                # Next request re-runs ee.Initialize from the cached credentials
+                GEEIntegration._initialized = False
+            return
+        results[name] = outcome
+        ttl = STATIC_LAYER_TTL_S if fetcher in STATIC_FETCHERS else DYNAMIC_LAYER_TTL_S
+        layer_cache.set(cache_key, outcome, ttl)
+    
+    @staticmethod
+    def _dataset_response(
+        results: Dict[str, Dict[str, Any]],
+        latitude: float,
+        longitude: float,
+        radius_m: int
+    ) -> Dict[str, Any]:
+        """Merge per-dataset results in DATASET_FETCHERS order into the API response"""
+        collected_data = {}
+        for name, _ in DATASET_FETCHERS:
+            collected_data.update(results.get(name) or {})
+        
+        # Check if we got ANY data
+        if not collected_data:
+            logger.error("❌ No satellite data available from any source")
+            return {
+                "success": False,
+                "error": "No satellite data available from any GEE source for this location",
+                "code": GEEErrorCode.NO_DATA_AVAILABLE.value
             }
+        
+        logger.info(f"✓ Retrieved data from {len(collected_data)} parameters/sources")
+        
+        return {
+            "success": True,
+            "data": {
+                "bands": collected_data,
+                "metadata": {
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "radius_m": radius_m,
+                    "parameters_count": len(collected_data),
+                    "parameters": list(collected_data.keys()),
+                    "query_date": datetime.now().isoformat()
+                }
+            }
+        }
     
     @classmethod
     def fetch_dem_data(
@@ -517,6 +1499,13 @@ class GEEIntegration:
             {success: bool, data: {...}, error: str}
         """
         try:
+            # Checked before initialization so cached DEMs never wait on ee.Initialize
+            cache_key = layer_cache_key("usgs_3dep", latitude, longitude, radius_m)
+            stats = layer_cache.get(cache_key)
+            if stats is not None:
+                logger.info("✓ DEM served from layer cache")
+                return cls._dem_response(stats)
+            
             if not cls._initialized:
                 init_result = cls.initialize()
                 if not init_result.get("success"):
@@ -525,7 +1514,7 @@ class GEEIntegration:
             logger.info(f"📐 Fetching DEM data for ({latitude}, {longitude})")
             
             point = ee.Geometry.Point([longitude, latitude])
-            roi = point.buffer(radius_m)
+            roi = _roi(point, radius_m)
             
             # Load USGS 3DEP/NED DEM
             dem = ee.Image("USGS/3DEP/10m").clip(roi)
@@ -535,30 +1524,36 @@ class GEEIntegration:
                 reducer=ee.Reducer.stats(),
                 geometry=roi,
                 scale=10,
-                maxPixels=1e6
+                **_radius_pixel_budget(radius_m, 10)
             ).getInfo()
             
+            layer_cache.set(cache_key, stats, STATIC_LAYER_TTL_S)
             logger.info(f"✓ Retrieved DEM: min={stats.get('elevation_min')}m, max={stats.get('elevation_max')}m")
             
-            return {
-                "success": True,
-                "data": {
-                    "elevation": stats,
-                    "metadata": {
-                        "dataset": "USGS 3DEP 10m",
-                        "resolution_m": 10,
-                        "crs": "EPSG:4326"
-                    }
-                }
-            }
+            return cls._dem_response(stats)
             
         except Exception as e:
             logger.error(f"❌ DEM fetch error: {str(e)}")
             return {
                 "success": False,
                 "error": str(e),
-                "code": "DEM_ERROR"
+                "code": GEEErrorCode.DEM_ERROR.value
+            }
+    
+    @staticmethod
+    def _dem_response(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap DEM elevation statistics in the fetch_dem_data response shape"""
+        return {
+            "success": True,
+            "data": {
+                "elevation": stats,
+                "metadata": {
+                    "dataset": "USGS 3DEP 10m",
+                    "resolution_m": 10,
+                    "crs": "EPSG:4326"
+                }
             }
+        }
     
     @classmethod
     def calculate_spectral_indices(
@@ -604,12 +1599,12 @@ class GEEIntegration:
             indices_image = ndvi.addBands(ndii).addBands(sr)
             
             # Get statistics
-            stats = indices_image.reduceRegion(
-                reducer=ee.Reducer.mean(),
-                geometry=ee.Geometry(roi_geometry),
-                scale=10,
-                maxPixels=1e6
-            ).getInfo()
+            stats = _reduce_tiled(
+                indices_image,
+                ee.Geometry(roi_geometry),
+                10,
+                _geojson_area_m2(roi_geometry)
+            )
             
             logger.info(f"✓ Calculated spectral indices: {list(stats.keys())}")
             
@@ -623,7 +1618,7 @@ class GEEIntegration:
             return {
                 "success": False,
                 "error": str(e),
-                "code": "INDEX_ERROR"
+                "code": GEEErrorCode.INDEX_ERROR.value
             }
 
 
@@ -642,6 +1637,23 @@ def fetch_satellite_data(
     return GEEIntegration.fetch_sentinel2_data(latitude, longitude, **kwargs)
 
 
+async def fetch_satellite_data_async(
+    latitude: float,
+    longitude: float,
+    **kwargs
+) -> Dict[str, Any]:
+    """Fetch Sentinel-2 data for a location without blocking the event loop"""
+    return await GEEIntegration.fetch_sentinel2_data_async(latitude, longitude, **kwargs)
+
+
+def fetch_satellite_data_batch(
+    points: List[Tuple[float, float]],
+    **kwargs
+) -> Dict[str, Any]:
+    """Fetch satellite data for many locations in one batch"""
+    return GEEIntegration.fetch_sentinel2_batch(points, **kwargs)
+
+
 def fetch_elevation_data(
     latitude: float,
     longitude: float,
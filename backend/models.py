@@ -3,8 +3,8 @@ Aurora OSI v3 - Data Models
 Pydantic models for API requests/responses
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, List, Optional, Dict, Tuple
 from datetime import datetime
 from enum import Enum
 from enum import Enum as EnumBase
@@ -62,6 +62,8 @@ class PixelSpectrum(BaseModel):
 
 class MineralDetectionResult(BaseModel):
     """Result of mineral detection"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     mineral: str
     confidence_score: float = Field(..., ge=0.0, le=1.0)
     confidence_tier: DetectionTier
@@ -277,4 +279,59 @@ class ScanHistoryResponse(BaseModel):
     scan_id: str
     metadata: ScanMetadata
     results: Optional[ScanResult] = None
-    summary: str
\ No newline at end of file
+    summary: str
+
+class PointRequest(BaseModel):
+    """Request body anchored on a single latitude/longitude"""
+    model_config = ConfigDict(extra="allow")
+
+    latitude: float
+    longitude: float
+
+
+class ScanCreateRequest(PointRequest):
+    """Request to create a new scan record"""
+    scan_name: Optional[str] = None
+    user_id: Optional[str] = None
+
+
+class AOIRequest(PointRequest):
+    """Point plus radius area of interest for GEE fetches"""
+    radius_m: int = 5000
+
+
+class Sentinel2Request(AOIRequest):
+    """Sentinel-2 fetch parameters"""
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    max_cloud_cover: float = 0.2
+    mode: str = "auto"
+
+
+class SceneRequest(PointRequest):
+    """Single-scene fetch parameters for /gee/landsat8"""
+    date_start: Optional[str] = None
+    date_end: Optional[str] = None
+
+
+class ScanSubmitRequest(BaseModel):
+    """Request body for POST /scans"""
+    model_config = ConfigDict(extra="allow")
+
+    location: Any
+    scan_type: str
+    minerals: List[Any]
+
+
+class SeismicSurveyRequest(BaseModel):
+    """Seismic survey grid dimensions"""
+    model_config = ConfigDict(extra="allow")
+
+    inline_count: int = 0
+    crossline_count: int = 0
+    depth_samples: int = 0
+
+
+class SeismicJobRequest(BaseModel):
+    """Seismic processing job for a campaign"""
+    campaignId: str = "unknown"
@@ -7,7 +7,7 @@ import asyncio
 import logging
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 from sqlalchemy import text
 from enum import Enum
 
@@ -226,25 +226,55 @@ class ScanManager:
             
             results = db.execute(text(query), params).fetchall()
             
-            return [
-                {
-                    "scan_id": r[0],
-                    "scan_type": r[1],
-                    "status": r[2],
-                    "location": f"{r[4] or r[5]} {r[6] or ''}".strip(),
-                    "area_km2": r[7],
-                    "minerals": r[8] or [],
-                    "created_at": r[9],
-                    "completed_at": r[10],
-                    "detections_found": r[11],
-                }
-                for r in results
-            ]
+            return [self._scan_summary(r) for r in results]
             
         except Exception as e:
             logger.error(f"✗ Failed to list scans: {str(e)}")
             return []
 
+    def iter_scans(self, limit: int = 100, offset: int = 0, status: Optional[str] = None,
+                   batch_size: int = 500) -> Iterator[Dict]:
+        """
+        Yield scan summaries one at a time from a server-side cursor.
+
+        Rows are fetched in batches of `batch_size`, so a large listing is never
+        held in memory at once. Blocking - iterate from a worker thread.
+        """
+        query = """
+            SELECT 
+                scan_id, scan_type, status, latitude, longitude,
+                country, region, area_km2, minerals,
+                created_at, completed_at, detections_found
+            FROM scans
+            """
+        params = {"limit": limit, "offset": offset}
+        if status:
+            query += " WHERE status = %(status)s"
+            params["status"] = status
+        query += " ORDER BY created_at DESC LIMIT %(limit)s OFFSET %(offset)s"
+
+        with get_db().get_connection() as conn:
+            with conn.cursor(name=f"scan_list_{uuid.uuid4().hex[:8]}") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(query, params)
+                for r in cursor:
+                    yield self._scan_summary(r)
+
+    @staticmethod
+    def _scan_summary(r) -> Dict:
+        """Map a scans row (list_scans column order) to its API summary"""
+        return {
+            "scan_id": r[0],
+            "scan_type": r[1],
+            "status": r[2],
+            "location": f"{r[4] or r[5]} {r[6] or ''}".strip(),
+            "area_km2": r[7],
+            "minerals": r[8] or [],
+            "created_at": r[9],
+            "completed_at": r[10],
+            "detections_found": r[11],
+        }
+
     async def delete_scan(self, scan_id: str) -> bool:
         """Delete a scan and its results"""
         db = get_db()
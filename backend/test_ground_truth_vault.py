@@ -0,0 +1,157 @@
+"""
+Aurora OSI v3 - Ground Truth Vault Tests
+Unit tests for batch ingestion and dry-hole risk in the A-GTV engine
+"""
+
+import pytest
+
+from ground_truth_vault import (
+    AuroraCommonSchema,
+    GroundTruthVault,
+    Mineral,
+    cKDTree,
+)
+
+
+def _assay(lat: float, lon: float, value: float = 2.0, **fields) -> AuroraCommonSchema:
+    """A valid gold assay record at (lat, lon)"""
+    return AuroraCommonSchema(
+        latitude=lat,
+        longitude=lon,
+        measurement_type="assay_ppm",
+        measurement_value=value,
+        measurement_unit="ppm",
+        mineral_context={},
+        **fields
+    )
+
+
+class TestIngestRecords:
+    """Test batch ingestion"""
+
+    def test_partial_failure_reports_batch_index(self):
+        """Rejected records are reported by their position in the batch"""
+        vault = GroundTruthVault()
+        records = [
+            _assay(9.15, -1.5),
+            _assay(200.0, -1.5),  # invalid latitude
+            _assay(9.16, -1.5),
+            AuroraCommonSchema(latitude=9.17, longitude=-1.5, mineral_context={}),  # no measurement type
+        ]
+
+        ids, errors = vault.ingest_records(records)
+
+        assert len(ids) == 2
+        assert [e["index"] for e in errors] == [1, 3]
+        assert set(ids) == set(vault.records)
+        assert vault.records[ids[0]] is records[0]
+        assert vault.records[ids[1]] is records[2]
+
+    def test_ingest_record_wraps_batch(self):
+        """Single-record ingest returns (id, success, error)"""
+        vault = GroundTruthVault()
+
+        record_id, success, error = vault.ingest_record(_assay(9.15, -1.5))
+        assert success and error is None
+        assert record_id in vault.records
+
+        record_id, success, error = vault.ingest_record(_assay(9.15, 500.0))
+        assert not success
+        assert record_id == ""
+        assert error
+
+    def test_conflicts_detected_within_batch(self):
+        """Later batch entries are checked against earlier ones"""
+        vault = GroundTruthVault()
+
+        vault.ingest_records([_assay(9.15, -1.5, value=2.0), _assay(9.15, -1.5, value=10.0)])
+
+        conflicts = vault.get_conflicting_records()
+        assert len(conflicts) == 1
+        assert conflicts[0].conflict_type == "assay_ppm_contradiction"
+        assert conflicts[0].severity_level == "critical"
+        assert list(vault.iter_conflicting_records(limit=0)) == []
+
+
+class TestDryHoleRisk:
+    """Test dry-hole risk over empty and populated grid cells"""
+
+    def test_empty_vault(self):
+        """No data within the radius: density zero and no anchors"""
+        vault = GroundTruthVault()
+
+        risk = vault.calculate_dry_hole_risk(9.15, -1.5, Mineral.GOLD)
+
+        assert risk["data_density"] == 0
+        assert risk["anchor_records"] == []
+        assert risk["grade_probability"] == 0.3
+        assert 0 <= risk["risk_percent"] <= 100
+
+    def test_populated_vs_empty_cell(self):
+        """Records near the target count; a target far from all data sees none"""
+        vault = GroundTruthVault()
+        ids, _ = vault.ingest_records([_assay(9.15 + i * 0.001, -1.5) for i in range(6)])
+
+        near = vault.calculate_dry_hole_risk(9.15, -1.5, Mineral.GOLD, search_radius_km=5.0)
+        far = vault.calculate_dry_hole_risk(-30.0, 120.0, Mineral.GOLD, search_radius_km=5.0)
+
+        assert near["data_density"] == 6
+        assert near["anchor_records"] == ids[:5]
+        assert near["grade_probability"] > 0.3
+        assert far["data_density"] == 0
+        assert far["anchor_records"] == []
+
+    def test_radius_is_great_circle(self):
+        """A record just outside the radius is excluded even when its grid cell is covered"""
+        vault = GroundTruthVault()
+        vault.ingest_records([_assay(9.15, -1.5), _assay(9.15 + 0.06, -1.5)])  # ~6.7 km north
+
+        risk = vault.calculate_dry_hole_risk(9.15, -1.5, Mineral.GOLD, search_radius_km=5.0)
+
+        assert risk["data_density"] == 1
+
+    def test_ingest_invalidates_memo(self):
+        """A memoised empty result is dropped once data arrives in the cell"""
+        vault = GroundTruthVault()
+        assert vault.calculate_dry_hole_risk(9.15, -1.5)["data_density"] == 0
+
+        vault.ingest_records([_assay(9.15, -1.5)])
+
+        assert vault.calculate_dry_hole_risk(9.15, -1.5)["data_density"] == 1
+
+    def test_memo_returns_copies(self):
+        """Callers cannot mutate the memoised result"""
+        vault = GroundTruthVault()
+        vault.calculate_dry_hole_risk(9.15, -1.5)["data_density"] = 99
+
+        assert vault.calculate_dry_hole_risk(9.15, -1.5)["data_density"] == 0
+
+    def test_memo_nested_values_are_copies(self):
+        """Mutating anchor_records or mineral_context does not leak into later calls"""
+        vault = GroundTruthVault()
+        ids, _ = vault.ingest_records([_assay(9.15, -1.5)])
+
+        risk = vault.calculate_dry_hole_risk(9.15, -1.5)
+        risk["anchor_records"].clear()
+        risk["mineral_context"]["typical_hosts"].append("basalt")
+
+        again = vault.calculate_dry_hole_risk(9.15, -1.5)
+        assert again["anchor_records"] == ids
+        assert "basalt" not in again["mineral_context"]["typical_hosts"]
+        assert "basalt" not in Mineral.GOLD.context["typical_hosts"]
+
+    @pytest.mark.skipif(cKDTree is None, reason="scipy not installed")
+    def test_kd_tree_matches_linear_scan(self):
+        """Indexed lookups agree with the unindexed tail scan"""
+        vault = GroundTruthVault()
+        vault.ingest_records([_assay(9.0 + i * 0.0005, -1.5) for i in range(600)])
+        indexed = vault.calculate_dry_hole_risk(9.1, -1.5, search_radius_km=2.0)
+
+        unindexed = GroundTruthVault()
+        unindexed._spatial_index = lambda: (0, None)
+        unindexed.ingest_records([_assay(9.0 + i * 0.0005, -1.5) for i in range(600)])
+
+        assert vault._index[1] is not None
+        assert indexed["data_density"] == unindexed.calculate_dry_hole_risk(
+            9.1, -1.5, search_radius_km=2.0
+        )["data_density"]
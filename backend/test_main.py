@@ -9,7 +9,9 @@ from datetime import datetime
 import json
 
 # Import the FastAPI app
-from main import app
+import main
+from main import app, _parse_scan_cursor, _scan_cursor
+from ground_truth_vault import GroundTruthVault
 
 client = TestClient(app)
 
@@ -446,6 +448,127 @@ class TestCORSHeaders:
         assert response.status_code == 200
 
 
+class TestGroundTruthVault:
+    """Test A-GTV batch ingestion, conflicts and dry-hole risk endpoints"""
+    
+    @pytest.fixture(autouse=True)
+    def vault(self):
+        """Fresh, empty vault for each test"""
+        previous = getattr(app.state, "vault", None)
+        app.state.vault = GroundTruthVault()
+        yield app.state.vault
+        app.state.vault = previous
+    
+    @staticmethod
+    def _assay(lat, lon, value=2.0):
+        return {
+            "latitude": lat,
+            "longitude": lon,
+            "measurement_type": "assay_ppm",
+            "measurement_value": value,
+            "measurement_unit": "ppm"
+        }
+    
+    def test_ingest_batch_partial_failure(self, vault):
+        """Failed indices refer to the request list; gtc_scores align with record_ids"""
+        records = [
+            self._assay(9.15, -1.5),
+            {"longitude": -1.5, "measurement_type": "lithology"},  # no latitude
+            self._assay(200.0, -1.5),  # rejected by the vault
+            self._assay(9.16, -1.5, value=2.1)
+        ]
+        response = client.post("/gtv/ingest_batch", json={"records": records, "batch_size": 2})
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["success"] is True
+        assert data["ingested"] == 2
+        assert [f["index"] for f in data["failed"]] == [1, 2]
+        assert len(data["gtc_scores"]) == len(data["record_ids"]) == 2
+        assert data["gtc_scores"] == [vault.calculate_gtc_score(r) for r in data["record_ids"]]
+        assert vault.records[data["record_ids"][1]].measurement_value == 2.1
+    
+    def test_ingest_batch_requires_records(self):
+        """An empty batch is an error payload, not an exception"""
+        response = client.post("/gtv/ingest_batch", json={"records": []})
+        assert response.status_code == 200
+        assert response.json()["code"] == "INVALID_REQUEST"
+    
+    def test_conflicts_ndjson(self):
+        """Conflicts stream one JSON object per line when NDJSON is accepted"""
+        client.post("/gtv/ingest_batch", json={"records": [
+            self._assay(9.15, -1.5, value=2.0),
+            self._assay(9.15, -1.5, value=10.0)
+        ]})
+        
+        response = client.get("/gtv/conflicts", headers={"Accept": "application/x-ndjson"})
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 1
+        assert lines[0]["type"] == "assay_ppm_contradiction"
+        
+        data = client.get("/gtv/conflicts").json()
+        assert data["total_conflicts"] == 1
+        assert data["conflicts"] == lines
+    
+    def test_dry_hole_risk_empty_vs_populated(self):
+        """Data density reflects records within the search radius"""
+        location = {"latitude": 9.15, "longitude": -1.5, "mineral": "Au"}
+        
+        empty = client.post("/gtv/dry-hole-risk", json=location).json()
+        assert empty["data_density_nearby"] == 0
+        assert empty["anchor_records"] == []
+        
+        client.post("/gtv/ingest_batch", json={"records": [self._assay(9.15 + i * 0.001, -1.5) for i in range(6)]})
+        
+        populated = client.post("/gtv/dry-hole-risk", json=location).json()
+        assert populated["data_density_nearby"] == 6
+        assert len(populated["anchor_records"]) == 5
+
+
+class TestScanHistoryCursor:
+    """Test keyset pagination on /scans/history"""
+    
+    def test_cursor_round_trip(self):
+        """A cursor built from a row parses back to that row's (timestamp, id)"""
+        row = {"id": "scan|42", "timestamp": "2026-01-20T10:30:00.123456"}
+        
+        assert _parse_scan_cursor(_scan_cursor(row)) == (datetime(2026, 1, 20, 10, 30, 0, 123456), "scan|42")
+    
+    @pytest.mark.parametrize("cursor", ["", "2026-01-20T10:30:00", "2026-01-20T10:30:00|", "not-a-date|scan-1"])
+    def test_malformed_cursor(self, cursor):
+        """Malformed cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            _parse_scan_cursor(cursor)
+    
+    def test_next_page_uses_header_cursor(self, monkeypatch):
+        """X-Next-Cursor of a full page is passed back to the DB as the keyset position"""
+        calls = []
+        
+        class FakeScanDB:
+            def get_all_scans(self, limit=50, after=None):
+                calls.append(after)
+                return [
+                    {"id": f"scan-{i}", "timestamp": f"2026-01-20T10:0{i}:00"}
+                    for i in range(limit)
+                ]
+        
+        monkeypatch.setattr(main, "scan_db", FakeScanDB())
+        
+        first = client.get("/scans/history", params={"limit": 2})
+        assert first.status_code == 200
+        cursor = first.headers["X-Next-Cursor"]
+        assert cursor == "2026-01-20T10:01:00|scan-1"
+        
+        client.get("/scans/history", params={"limit": 2, "cursor": cursor})
+        assert calls == [None, (datetime(2026, 1, 20, 10, 1), "scan-1")]
+    
+    def test_invalid_cursor_rejected(self):
+        """A malformed cursor is a 400"""
+        response = client.get("/scans/history", params={"cursor": "garbage"})
+        assert response.status_code == 400
+
+
 class TestResponseFormats:
     """Test response format consistency"""
     